@@ -15,7 +15,9 @@
 import copy
 import logging
 from abc import abstractmethod
-from typing import List, Optional, Set, Type, TypeVar, Union, Iterator
+from typing import (
+    Any, Dict, Iterable, List, Optional, Sequence, Set, Type, TypeVar, Union,
+    Iterator)
 
 import jsonpickle
 
@@ -139,6 +141,50 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         """
         raise NotImplementedError
 
+    def bulk_create_entries(
+            self, entry_type: Type[EntryType],
+            kwargs_iter: Iterable[Dict[str, Any]]) -> List[EntryType]:
+        r"""Create the entries of ``entry_type`` in bulk and add them to the
+        pack. The validation and the creation records of the entries are
+        done once for all of them, instead of per entry. As with the entries
+        created one by one, the result of the validation is not enforced.
+
+        Example:
+
+            .. code-block:: python
+
+                tokens = pack.bulk_create_entries(
+                    Token, ({"begin": b, "end": e} for b, e in spans))
+
+        Args:
+            entry_type: The type of the entries to create.
+            kwargs_iter: The keyword arguments to create each entry with,
+                except the pack.
+
+        Returns:
+            The entries created, in the order of ``kwargs_iter``.
+        """
+        if self._bulk_tids is not None:
+            raise ValueError("The entries are already being created in bulk.")
+
+        tids: List[int] = []
+        self._bulk_tids = tids
+        try:
+            entries: List[EntryType] = [
+                entry_type(self, **kwargs)
+                for kwargs in kwargs_iter]
+        finally:
+            self._bulk_tids = None
+
+        if len(entries) == 0:
+            return entries
+        # The entries are of the same type, so one validation covers all.
+        self.validate(entries[0])
+        self.add_entry_creation_records(tids)
+        for entry in entries:
+            self.add_entry(entry)
+        return entries
+
     def add_entry_(self, entry: EntryType) -> int:
         """
         A slightly different variation from `add_entry` function, it returns
@@ -221,6 +267,27 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         except KeyError:
             self.creation_records[c] = {entry_id}
 
+    def add_entry_creation_records(self, entry_ids: Iterable[int]):
+        """
+        Record who creates the entries, the batch version of
+        :meth:`add_entry_creation_record`.
+
+        Args:
+            entry_ids: The ids of the entries.
+
+        Returns:
+
+        """
+        c = self.__control_component
+
+        if c is None:
+            c = self._pack_manager.get_input_source()
+
+        try:
+            self.creation_records[c].update(entry_ids)
+        except KeyError:
+            self.creation_records[c] = set(entry_ids)
+
     def add_field_record(self, entry_id: int, field_name: str):
         """
         Record who modifies the entry, will be called
@@ -252,6 +319,22 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
                 f"There is no entry with tid '{tid}'' in this datapack")
         return entry
 
+    def get_entries_by_ids(self, tids: Sequence[int]) -> List[EntryType]:
+        r"""Look up the entry_index with multiple tids at once.
+
+        Args:
+            tids: The tids of the entries.
+
+        Returns:
+            A list of the entries, in the order of ``tids``.
+        """
+        try:
+            return self.index.get_entries(tids)
+        except KeyError as e:
+            raise KeyError(
+                f"There is no entry with tid '{e.args[0]}'' in this "
+                f"datapack") from None
+
     def get_ids_by_component(self, component: str) -> Set[int]:
         r"""Look up the component_index with key ``component``."""
         entry_set: Set[int] = self.creation_records[component]
@@ -16,8 +16,12 @@ Forte Container module.
 """
 
 from abc import abstractmethod
-from typing import Dict, Generic, Set, Tuple, TypeVar
+from typing import (
+    Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar)
 
+import numpy as np
+
+from forte.data.embedding_store import EmbeddingStore
 from forte.data.span import Span
 
 __all__ = [
@@ -58,6 +62,14 @@ class EntryContainer(Generic[E, L, G]):
         # The Id manager controls the ID management in this container
         self._id_manager = EntryIdManager()
 
+        # The embeddings of the entries, stored as contiguous matrices.
+        self._embedding_store = EmbeddingStore()
+
+        # The ids of the entries created in the bulk mode, of which the
+        # validation and the creation records are deferred. It is None when
+        # the container is not in the bulk mode.
+        self._bulk_tids: Optional[List[int]] = None
+
     def __getstate__(self):
         r"""In serialization:
             - We create a special field for serialization information.
@@ -69,15 +81,21 @@ class EntryContainer(Generic[E, L, G]):
         state['serialization']['next_id'] = \
             self._id_manager.current_id_counter()
         state.pop('_id_manager')
+        state.pop('_bulk_tids', None)
         return state
 
     def __setstate__(self, state):
         r"""In deserialization,
             - The :class:`IdManager` is recreated from the id count.
+            - An empty :class:`EmbeddingStore` is created if the container is
+              serialized without one.
         """
         self.__dict__.update(state)
         self.__dict__.pop('serialization')
         self._id_manager = EntryIdManager(state['serialization']['next_id'])
+        if '_embedding_store' not in state:
+            self._embedding_store = EmbeddingStore()
+        self._bulk_tids = None
 
     @abstractmethod
     def add_entry_creation_record(self, entry_id: int):
@@ -102,11 +120,99 @@ class EntryContainer(Generic[E, L, G]):
     def get_entry(self, tid: int):
         raise NotImplementedError
 
+    def get_entries_by_ids(self, tids: Sequence[int]) -> List[E]:
+        return [self.get_entry(tid) for tid in tids]
+
     def get_span_text(self, span: Span):
         raise NotImplementedError
 
     def get_next_id(self):
         return self._id_manager.get_id()
 
+    def get_embedding(self, tid: int) -> Optional[np.ndarray]:
+        r"""Get the embedding of the entry ``tid``, which is a read-only array,
+        use :meth:`set_embedding` to change it. Returns None if the embedding
+        is not set.
+        """
+        return self._embedding_store.get(tid)
+
+    def set_embedding(self, tid: int, embedding):
+        r"""Set the embedding of the entry ``tid``.
+
+        Args:
+            tid: The id of the entry.
+            embedding: The embedding vectors which can be numpy array of floats
+                or list of floats.
+        """
+        self._embedding_store.set(tid, embedding)
+
+    def set_embedding_dtype(self, dtype):
+        r"""Set the data type used to store the embeddings in this container,
+        the embeddings already stored are converted.
+
+        Args:
+            dtype: One of ``float32`` (the default), ``float64``, ``float16``
+                and ``int8``. The ``int8`` embeddings are quantized with a
+                scale per embedding, reading them returns de-quantized copies.
+        """
+        self._embedding_store.set_dtype(dtype)
+
+    def delete_embedding(self, tid: int):
+        r"""Delete the embedding of the entry ``tid`` if there is one."""
+        self._embedding_store.remove(tid)
+
+    def embeddings_matrix(
+            self, shape: Optional[Tuple[int, ...]] = None) -> np.ndarray:
+        r"""Get the embeddings of the entries as one ``(N, D)`` matrix, each
+        row is a flattened embedding. The matrix is a view of the storage, and
+        its rows follow the order of :meth:`embedding_tids`.
+
+        Args:
+            shape: The shape of the embeddings to get. It can be omitted when
+                all the embeddings in this container are of the same shape.
+        """
+        return self._embedding_store.get_matrix(shape).matrix()
+
+    def normalize_embeddings(self, shape: Optional[Tuple[int, ...]] = None):
+        r"""Normalize the (flattened) embeddings to unit L2 norm in place.
+
+        Args:
+            shape: The shape of the embeddings to normalize. It can be omitted
+                when all the embeddings in this container are of the same
+                shape.
+        """
+        self._embedding_store.get_matrix(shape).normalize()
+
+    def top_k_similar(
+            self, query, k: int = 10,
+            shape: Optional[Tuple[int, ...]] = None) -> List[Tuple[int, float]]:
+        r"""Find the entries whose (flattened) embeddings have the largest dot
+        products with the query. Call :meth:`normalize_embeddings` first (and
+        normalize the query) to rank the entries by cosine similarity.
+
+        Args:
+            query: The query embedding, with the same size as the embeddings.
+            k: The number of entries to find.
+            shape: The shape of the embeddings to search. It can be omitted
+                when all the embeddings in this container are of the same
+                shape.
+
+        Returns:
+            A list of up to ``k`` (tid, score) pairs, in the descending order of
+            the scores.
+        """
+        matrix = self._embedding_store.get_matrix(shape)
+        return matrix.top_k(np.reshape(query, (1, matrix.dim)), k)[0]
+
+    def embedding_tids(
+            self, shape: Optional[Tuple[int, ...]] = None) -> List[int]:
+        r"""Get the tids of the rows of :meth:`embeddings_matrix`.
+
+        Args:
+            shape: The shape of the embeddings to get. It can be omitted when
+                all the embeddings in this container are of the same shape.
+        """
+        return self._embedding_store.get_matrix(shape).tids()
+
 
 ContainerType = TypeVar("ContainerType", bound=EntryContainer)
@@ -414,6 +414,9 @@ class DataPack(BasePack[Entry, Link, Group]):
         # update basic index
         self.index.remove_entry(entry)
 
+        # remove the embedding of the entry
+        self.delete_embedding(entry.tid)
+
         # set other index invalid
         self.index.turn_link_index_switch(on=False)
         self.index.turn_group_index_switch(on=False)
@@ -0,0 +1,114 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Numeric kernels over the embedding matrices of
+:class:`~forte.data.embedding_store.EmbeddingStore`. The kernels are compiled
+with Numba when it is installed, and fall back to NumPy otherwise.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+__all__ = [
+    "l2_normalize",
+    "top_k",
+]
+
+if _HAS_NUMBA:
+    # The signatures compile the kernels for C-contiguous float matrices when
+    # this module is imported (and cached on disk), instead of on first call.
+    @njit(["void(float32[:, ::1])", "void(float64[:, ::1])"],
+          parallel=True, fastmath=True, cache=True)
+    def _l2_normalize_jit(matrix):
+        for i in prange(matrix.shape[0]):  # pylint: disable=not-an-iterable
+            norm = 0.0
+            for j in range(matrix.shape[1]):
+                norm += matrix[i, j] * matrix[i, j]
+            if norm > 0:
+                inv = 1.0 / math.sqrt(norm)
+                for j in range(matrix.shape[1]):
+                    matrix[i, j] *= inv
+
+    @njit(["int64[:, ::1](float32[:, ::1], int64)",
+           "int64[:, ::1](float64[:, ::1], int64)"],
+          parallel=True, cache=True)
+    def _top_k_jit(scores, k):
+        result = np.empty((scores.shape[0], k), dtype=np.int64)
+        for i in prange(scores.shape[0]):  # pylint: disable=not-an-iterable
+            # Keep the best k indices in descending order of the scores,
+            # inserting each better candidate at its place.
+            best = np.empty(k, dtype=np.int64)
+            size = 0
+            for j in range(scores.shape[1]):
+                score = scores[i, j]
+                if size == k and score <= scores[i, best[k - 1]]:
+                    continue
+                pos = size if size < k else k - 1
+                while pos > 0 and scores[i, best[pos - 1]] < score:
+                    best[pos] = best[pos - 1]
+                    pos -= 1
+                best[pos] = j
+                if size < k:
+                    size += 1
+            result[i] = best
+        return result
+
+
+def _is_jit_compatible(array: np.ndarray) -> bool:
+    return _HAS_NUMBA and array.ndim == 2 and \
+        array.dtype in (np.float32, np.float64) and \
+        array.flags.c_contiguous
+
+
+def l2_normalize(matrix: np.ndarray):
+    r"""Normalize the rows of ``matrix`` to unit L2 norm in place. The rows of
+    zeros are left unchanged.
+
+    Args:
+        matrix: A 2-D float matrix.
+    """
+    if _is_jit_compatible(matrix) and matrix.flags.writeable:
+        _l2_normalize_jit(matrix)
+        return
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    matrix /= norms.astype(matrix.dtype)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    r"""Find the indices of the ``k`` largest scores of each row.
+
+    Args:
+        scores: A 2-D ``(Q, N)`` float matrix of scores.
+        k: The number of indices to find, at most ``N``.
+
+    Returns:
+        A ``(Q, k)`` matrix of indices, in the descending order of the scores.
+    """
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64)
+    if _is_jit_compatible(scores):
+        return _top_k_jit(scores, k)
+    indices = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(
+        -np.take_along_axis(scores, indices, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(indices, order, axis=1)
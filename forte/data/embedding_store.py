@@ -0,0 +1,401 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The storage of the entry embeddings of a container.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+__all__ = [
+    "EmbeddingMatrix",
+    "EmbeddingStore",
+]
+
+Shape = Tuple[int, ...]
+DType = Union[str, type, np.dtype]
+
+# The data types supported by the embedding storage. The ``int8`` embeddings
+# are quantized per row, see :class:`EmbeddingMatrix`.
+SUPPORTED_DTYPES = (
+    np.dtype(np.float16), np.dtype(np.float32), np.dtype(np.float64),
+    np.dtype(np.int8))
+
+
+def _check_dtype(dtype: DType) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(
+            f"Unsupported embedding data type {dtype}, the supported ones "
+            f"are: {[str(t) for t in SUPPORTED_DTYPES]}.")
+    return dtype
+
+
+class EmbeddingMatrix:
+    r"""Store embeddings of the same shape as the rows of one contiguous
+    matrix. Each embedding is flattened into one row, the matrix grows
+    geometrically when it is full.
+
+    With the ``int8`` data type, each row ``v`` is quantized symmetrically as
+    ``q = round(v / scale)``, where ``scale = max(abs(v)) / 127`` is stored per
+    row. The embeddings read from such a matrix are de-quantized copies.
+
+    Args:
+        shape: The shape of the embeddings stored in this matrix.
+        dtype: The data type of the matrix, one of ``float16``, ``float32``,
+            ``float64`` and ``int8``.
+    """
+
+    def __init__(self, shape: Shape, dtype: DType = np.float32):
+        self.shape: Shape = shape
+        self.dim: int = int(np.prod(shape, dtype=np.int64))
+        self._data: np.ndarray = np.empty(
+            (0, self.dim), dtype=_check_dtype(dtype))
+        # The quantization scale of each row, only used by int8 matrices.
+        self._scales: Optional[np.ndarray] = np.empty(
+            0, dtype=np.float32) if self.quantized else None
+
+        # The tid stored at each used row, None if the row is deleted.
+        self._row_tids: List[Optional[int]] = []
+        # Mapping from the tid to its row.
+        self._rows: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, tid: int) -> bool:
+        return tid in self._rows
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    @property
+    def quantized(self) -> bool:
+        return self._data.dtype == np.int8
+
+    def get(self, tid: int) -> np.ndarray:
+        r"""Get the embedding of ``tid``, which is a read-only view of its
+        row. For quantized matrices, this is a de-quantized ``float32`` copy.
+        """
+        row = self._rows[tid]
+        if self._scales is not None:
+            # The copy is read-only as well, since the writes would be lost.
+            embedding = (self._data[row].astype(np.float32) *
+                         self._scales[row]).reshape(self.shape)
+        else:
+            # The view is read-only, since the writes would be lost once the
+            # storage is re-allocated.
+            embedding = self._data[row].reshape(self.shape)
+        embedding.flags.writeable = False
+        return embedding
+
+    def set(self, tid: int, embedding: np.ndarray):
+        r"""Overwrite the row of ``tid``, or append a new row for it."""
+        row = self._rows.get(tid)
+        if row is None:
+            if (len(self._row_tids) == self._data.shape[0]
+                    and 2 * len(self._rows) <= len(self._row_tids)):
+                # Reclaim the holes instead of growing the storage, once at
+                # least half of the rows are removed.
+                self._compact()
+            row = len(self._row_tids)
+            if row == self._data.shape[0]:
+                self._grow(max(1, 2 * row))
+            self._row_tids.append(tid)
+            self._rows[tid] = row
+
+        if self._scales is not None:
+            vector = embedding.reshape(self.dim).astype(np.float32)
+            scale = np.abs(vector).max(initial=0) / 127
+            if scale == 0:
+                scale = 1.
+            self._data[row] = np.clip(
+                np.round(vector / scale), -128, 127).astype(np.int8)
+            self._scales[row] = scale
+        else:
+            self._data[row] = embedding.reshape(self.dim)
+
+    def remove(self, tid: int):
+        r"""Remove the embedding of ``tid``, the row is left as a hole until
+        the matrix is compacted.
+        """
+        row = self._rows.pop(tid)
+        self._row_tids[row] = None
+
+    def tids(self) -> List[int]:
+        r"""The tids of the rows of :meth:`matrix`, in the row order."""
+        self._compact()
+        return list(self._rows)
+
+    def matrix(self) -> np.ndarray:
+        r"""Get the ``(N, D)`` matrix of the live embeddings. This is a view of
+        the storage, the rows follow the order of :meth:`tids`. For quantized
+        matrices, the rows are to be multiplied by :meth:`scales`. The view is
+        only valid until the embeddings are added or removed.
+        """
+        self._compact()
+        return self._data[:len(self._rows)]
+
+    def scales(self) -> Optional[np.ndarray]:
+        r"""Get the quantization scales of the rows of :meth:`matrix`, or None
+        if the matrix is not quantized.
+        """
+        if self._scales is None:
+            return None
+        self._compact()
+        return self._scales[:len(self._rows)]
+
+    def dot(self, vectors: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+        r"""Compute the dot products between the stored embeddings and the
+        given vectors, i.e., ``matrix() @ vectors``. Quantized rows are
+        converted to ``float32`` one chunk at a time, and scaled back.
+
+        Args:
+            vectors: A vector of size ``D``, or a ``(D, K)`` matrix.
+            chunk_size: The number of quantized rows converted at a time.
+
+        Returns:
+            The dot products of size ``N`` or ``(N, K)``.
+        """
+        matrix = self.matrix()
+        if self._scales is None:
+            return matrix @ vectors
+        vectors = np.asarray(vectors, dtype=np.float32)
+        result = np.empty(
+            (len(matrix),) + vectors.shape[1:], dtype=np.float32)
+        for begin in range(0, len(matrix), chunk_size):
+            end = begin + chunk_size
+            result[begin:end] = matrix[begin:end].astype(np.float32) @ vectors
+        # The matrix is compacted, so its rows are the leading scales.
+        scales = self._scales[:len(matrix)]
+        return result * (scales if vectors.ndim == 1 else scales[:, None])
+
+    def normalize(self):
+        r"""Normalize the embeddings to unit L2 norm in place. For quantized
+        matrices, only the scales are changed.
+        """
+        # The kernels are imported here, so that they are only compiled when
+        # they are needed.
+        from forte.data.embedding_kernels import l2_normalize
+
+        matrix = self.matrix()
+        if self._scales is None:
+            l2_normalize(matrix)
+            return
+        norms = np.sqrt(np.einsum(
+            'ij,ij->i', matrix, matrix, dtype=np.float32))
+        scales = self.scales()
+        scales[norms > 0] = 1. / norms[norms > 0]
+
+    def top_k(self, queries: np.ndarray,
+              k: int) -> List[List[Tuple[int, float]]]:
+        r"""Find the embeddings with the largest dot products with each query.
+        Normalize the embeddings (and the queries) first to find the ones with
+        the largest cosine similarities.
+
+        Args:
+            queries: A ``(Q, D)`` matrix of queries.
+            k: The number of embeddings to find for each query.
+
+        Returns:
+            For each query, a list of up to ``k`` (tid, score) pairs, in the
+            descending order of the scores.
+        """
+        from forte.data.embedding_kernels import top_k
+
+        scores = np.ascontiguousarray(self.dot(np.asarray(queries).T).T)
+        tids = self.tids()
+        return [
+            [(tids[j], float(row_scores[j])) for j in row_indices]
+            for row_scores, row_indices in zip(scores, top_k(scores, k))
+        ]
+
+    def astype(self, dtype: DType) -> "EmbeddingMatrix":
+        r"""Create a copy of this matrix with another data type, the embeddings
+        are quantized or de-quantized as needed.
+        """
+        matrix = EmbeddingMatrix(self.shape, dtype)
+        for tid in self.tids():
+            matrix.set(tid, self.get(tid))
+        return matrix
+
+    def _grow(self, capacity: int):
+        size = len(self._row_tids)
+        data = np.empty((capacity, self.dim), dtype=self._data.dtype)
+        data[:size] = self._data[:size]
+        self._data = data
+        if self._scales is not None:
+            scales = np.empty(capacity, dtype=np.float32)
+            scales[:size] = self._scales[:size]
+            self._scales = scales
+
+    def _compact(self):
+        r"""Copy the live rows together into new storage, so that they are
+        the leading rows of the matrix. The rows are not moved in place, so
+        that the views returned earlier keep their own values.
+        """
+        if len(self._rows) == len(self._row_tids):
+            return
+        live = [row for row, tid in enumerate(self._row_tids)
+                if tid is not None]
+        self._data = self._data[live]
+        if self._scales is not None:
+            self._scales = self._scales[live]
+        self._row_tids = [self._row_tids[row] for row in live]
+        self._rows = {tid: row for row, tid in enumerate(self._row_tids)}
+
+    def __getstate__(self):
+        r"""In serialization, only the live rows are stored, as a raw buffer
+        together with their tids.
+        """
+        scales = self.scales()
+        return {
+            'shape': self.shape,
+            'dtype': self.dtype.str,
+            'tids': self.tids(),
+            'data': self.matrix().tobytes(),
+            'scales': None if scales is None else scales.tobytes(),
+        }
+
+    def __setstate__(self, state):
+        self.shape = tuple(state['shape'])
+        self.dim = int(np.prod(self.shape, dtype=np.int64))
+        self._row_tids = list(state['tids'])
+        self._rows = {tid: row for row, tid in enumerate(self._row_tids)}
+        # Copy the data out of the (read-only) buffer to keep it writable.
+        self._data = np.frombuffer(
+            state['data'], dtype=state['dtype']
+        ).reshape(len(self._row_tids), self.dim).copy()
+        scales = state.get('scales')
+        self._scales = None if scales is None else np.frombuffer(
+            scales, dtype=np.float32).copy()
+
+
+class EmbeddingStore:
+    r"""The embeddings of the entries in a container. Instead of holding one
+    small array per entry, the embeddings of the same shape are stored in one
+    :class:`EmbeddingMatrix`, so that they can be processed in bulk.
+
+    Args:
+        dtype: The data type used to store the embeddings, ``float32`` by
+            default. ``float16`` and ``int8`` (quantized) can be used to reduce
+            the memory footprint of large packs.
+    """
+
+    def __init__(self, dtype: DType = np.float32):
+        self._dtype: np.dtype = _check_dtype(dtype)
+        self._matrices: Dict[Shape, EmbeddingMatrix] = {}
+        # Mapping from the tid to the matrix holding its embedding.
+        self._tid_matrix: Dict[int, EmbeddingMatrix] = {}
+
+    def __contains__(self, tid: int) -> bool:
+        return tid in self._tid_matrix
+
+    def get(self, tid: int) -> Optional[np.ndarray]:
+        r"""Get the embedding of the entry ``tid``, None if it is not set."""
+        matrix = self._tid_matrix.get(tid)
+        if matrix is None:
+            return None
+        return matrix.get(tid)
+
+    def set(self, tid: int, embedding):
+        r"""Set the embedding of the entry ``tid``.
+
+        Args:
+            tid: The id of the entry.
+            embedding: The embedding, a numpy array or a (nested) list of
+                floats.
+        """
+        embedding = np.asarray(embedding)
+        matrix = self._matrices.get(embedding.shape)
+        if matrix is None:
+            matrix = EmbeddingMatrix(embedding.shape, self._dtype)
+            self._matrices[embedding.shape] = matrix
+
+        current = self._tid_matrix.get(tid)
+        if current is not None and current is not matrix:
+            self._remove_row(current, tid)
+        matrix.set(tid, embedding)
+        self._tid_matrix[tid] = matrix
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    def set_dtype(self, dtype: DType):
+        r"""Change the data type used to store the embeddings, the embeddings
+        already stored are converted.
+        """
+        self._dtype = _check_dtype(dtype)
+        for shape, matrix in list(self._matrices.items()):
+            if matrix.dtype != self._dtype:
+                new_matrix = matrix.astype(self._dtype)
+                self._matrices[shape] = new_matrix
+                for tid in new_matrix.tids():
+                    self._tid_matrix[tid] = new_matrix
+
+    def remove(self, tid: int):
+        r"""Remove the embedding of the entry ``tid`` if there is one."""
+        matrix = self._tid_matrix.pop(tid, None)
+        if matrix is not None:
+            self._remove_row(matrix, tid)
+
+    def _remove_row(self, matrix: EmbeddingMatrix, tid: int):
+        # The matrices left empty are dropped, so that they do not count as
+        # shapes in :meth:`get_matrix`.
+        matrix.remove(tid)
+        if len(matrix) == 0:
+            del self._matrices[matrix.shape]
+
+    def get_matrix(self, shape: Optional[Shape] = None) -> EmbeddingMatrix:
+        r"""Get the :class:`EmbeddingMatrix` storing the embeddings of the
+        given shape.
+
+        Args:
+            shape: The shape of the embeddings. It can be omitted when all
+                the embeddings in the store are of the same shape.
+        """
+        if shape is None:
+            if len(self._matrices) == 0:
+                raise ValueError("There is no embedding in this container.")
+            if len(self._matrices) > 1:
+                raise ValueError(
+                    f"The shape of the embeddings must be given when there "
+                    f"are embeddings of different shapes: "
+                    f"{list(self._matrices)}.")
+            return next(iter(self._matrices.values()))
+        try:
+            return self._matrices[tuple(shape)]
+        except KeyError:
+            raise ValueError(
+                f"There is no embedding of shape {tuple(shape)}.") from None
+
+    def __getstate__(self):
+        # The shapes (tuples) cannot be the keys in some serialization
+        # formats, such as JSON, so we only store the matrices.
+        return {
+            'dtype': self._dtype.str,
+            'matrices': list(self._matrices.values()),
+        }
+
+    def __setstate__(self, state):
+        self._dtype = np.dtype(state.get('dtype', np.float32))
+        self._matrices = {}
+        self._tid_matrix = {}
+        for matrix in state['matrices']:
+            self._matrices[matrix.shape] = matrix
+            for tid in matrix.tids():
+                self._tid_matrix[tid] = matrix
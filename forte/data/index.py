@@ -14,8 +14,9 @@
 
 import logging
 from collections import defaultdict
+from operator import itemgetter
 from typing import DefaultDict, Dict, List, Set, Type, Hashable, Generic, \
-    Iterable, Tuple
+    Iterable, Tuple, Sequence
 
 from forte.common.exception import PackIndexError
 from forte.data.ontology.core import GroupType, LinkType, EntryType
@@ -77,6 +78,21 @@ class BaseIndex(Generic[EntryType]):
     def get_entry(self, tid) -> EntryType:
         return self._entry_index[int(tid)]
 
+    def get_entries(self, tids: Sequence[int]) -> List[EntryType]:
+        r"""Look up the entries of multiple tids at once.
+
+        Args:
+            tids: The tids of the entries.
+
+        Returns:
+            A list of the entries, in the order of ``tids``.
+        """
+        if len(tids) == 0:
+            return []
+        if len(tids) == 1:
+            return [self._entry_index[tids[0]]]
+        return list(itemgetter(*tids)(self._entry_index))
+
     def iter_type_index(self) -> Iterable[Tuple[Type, Set[int]]]:
         for t, ids in self._type_index.items():
             yield t, ids
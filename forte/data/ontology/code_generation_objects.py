@@ -300,6 +300,16 @@ class Property(Item, ABC):
     def to_setstate(self, level):
         return change_set_state(self.name, self.field_name, level)
 
+    def to_set_all(self, missing_value: str, field_index: int, level: int):
+        field_name = self.field_name
+        return [
+            (f"if {field_name} is not {missing_value}:", level),
+            (f"self.{field_name} = {field_name}", level + 1),
+            (f"self._modified_mask |= 1 << {field_index}", level + 1),
+            (f"self.pack.add_field_record(self._tid, '{field_name}')",
+             level + 1),
+        ]
+
     def to_init_code(self, level: int) -> str:
         return indent_line(f"self.{self.field_name}: "
                            f"{self.internal_type_str()} = "
@@ -367,13 +377,13 @@ class NonCompositeProperty(Property):
                 (f"def {name}(self, {name}: {option_type}[{type_str}]):", 0),
                 (f"value = self.pack.add_entry({name}) "
                  f"if {name} is not None else None", 1),
-                (f"self.set_fields({self.field_name}=value)", 1),
+                (f"self._set_all({self.field_name}=value)", 1),
             ])
         else:
             lines.extend([
                 (f"@{self.name}.setter", 0),
                 (f"def {name}(self, {name}: {self.internal_type_str()}):", 0),
-                (f"self.set_fields({self.field_name}"
+                (f"self._set_all({self.field_name}"
                  f"={self.to_field_value()})", 1),
             ])
         return indent_code([indent_line(*line) for line in lines], level)
@@ -445,7 +455,7 @@ class DictProperty(Property):
                 (f"@{self.name}.setter", 0),
                 (f"def {name}(self, {name}: {self.access_type_str()}):", 0),
                 (f"{name} = {{}} if {name} is None else {name}", 1),
-                (f"self.set_fields("
+                (f"self._set_all("
                  f"{self.field_name}="
                  f"dict([(k, self.pack.add_entry_(v)) "
                  f"for k, v in {name}.items()]))", 1),
@@ -456,7 +466,7 @@ class DictProperty(Property):
                 (f"@{self.name}.setter", 0),
                 (f"def {name}(self, {name}: {self.access_type_str()}):", 0),
                 (f"{name} = {{}} if {name} is None else {name}", 1),
-                (f"self.set_fields("
+                (f"self._set_all("
                  f"{self.field_name}={name})", 1),
                 ('', 0),
             ])
@@ -557,7 +567,7 @@ class ListProperty(Property):
                 (f"@{self.name}.setter", 0),
                 (f"def {name}(self, {name}: {self.access_type_str()}):", 0),
                 (f"{name} = [] if {name} is None else {name}", 1),
-                (f"self.set_fields("
+                (f"self._set_all("
                  f"{self.field_name}="
                  f"[self.pack.add_entry_(obj) for obj in {name}])", 1),
                 ('', 0),
@@ -567,7 +577,7 @@ class ListProperty(Property):
                 (f"@{self.name}.setter", 0),
                 (f"def {name}(self, {name}: {self.access_type_str()}):", 0),
                 (f"{name} = [] if {name} is None else {name}", 1),
-                (f"self.set_fields("
+                (f"self._set_all("
                  f"{self.field_name}={name})", 1),
                 ('', 0),
             ])
@@ -631,7 +641,9 @@ class EntryDefinition(Item):
                  init_args: Optional[str] = None,
                  properties: Optional[List[Property]] = None,
                  class_attributes: Optional[List[ClassTypeDefinition]] = None,
-                 description: Optional[str] = None):
+                 description: Optional[str] = None,
+                 missing_value: Optional[str] = None,
+                 field_index: Optional[Dict[str, int]] = None):
         super().__init__(name, description)
         self.class_type = class_type
         self.properties: List[Property] = \
@@ -641,6 +653,11 @@ class EntryDefinition(Item):
         self.description = description if description else None
         self.init_args = init_args if init_args is not None else ''
         self.init_args = self.init_args.replace('=', ' = ')
+        self.missing_value = missing_value
+        # The bit indices of the fields in the mask of the modified fields,
+        # including the fields of the generated ancestors.
+        self.field_index: Dict[str, int] = \
+            {} if field_index is None else field_index
 
     def to_init_code(self, level: int) -> str:
         return indent_line(f"def __init__(self, {self.init_args}):", level)
@@ -671,6 +688,40 @@ class EntryDefinition(Item):
             lines.extend(p.to_setstate(1))
         return indent_code([indent_line(*line) for line in lines], level)
 
+    def to_set_all_code(self, level: int) -> Optional[str]:
+        if len(self.properties) == 0:
+            return None
+
+        # The sentinel is imported for the entries with properties.
+        missing_value = self.missing_value
+        assert missing_value is not None
+
+        lines = [("def _set_all(", 0), ("self, *,", 2)]
+        lines.extend([(f"{p.field_name}={missing_value},", 2)
+                      for p in self.properties])
+        lines.append(("**kwargs):", 2))
+        for p in self.properties:
+            lines.extend(p.to_set_all(
+                missing_value, self.field_index[p.field_name], 1))
+        lines.extend([
+            ("if kwargs:", 1),
+            ("super()._set_all(**kwargs)", 2),
+        ])
+        return indent_code([indent_line(*line) for line in lines], level)
+
+    def to_field_index_code(self, level: int) -> Optional[str]:
+        if len(self.properties) == 0:
+            return None
+
+        lines = [("_FIELD_INDEX = {", 0)]
+        lines.extend([(f"'{name}': {index},", 1)
+                      for name, index in self.field_index.items()])
+        lines.extend([
+            ("}", 0),
+            ("_FIELD_NAMES = list(_FIELD_INDEX)", 0),
+        ])
+        return indent_code([indent_line(*line) for line in lines], level)
+
     def to_code(self, level: int) -> str:
         super_args = ', '.join([item.split(':')[0].strip()
                                 for item in self.init_args.split(',')])
@@ -683,12 +734,14 @@ class EntryDefinition(Item):
         ]
         lines += [desc] if desc.strip() else []
         lines += [item.to_code(1) for item in self.class_attributes]
+        lines += [self.to_field_index_code(1)]
         lines += [self.to_init_code(1),
                   indent_line(f"super().__init__({super_args})", 2)]
         lines += [item.to_init_code(2) for item in self.properties]
         lines += ['']
         lines += [self.to_get_state_code(1)]
         lines += [self.to_set_state_code(1)]
+        lines += [self.to_set_all_code(1)]
         lines += [item.to_access_functions(1) for item in self.properties]
         return indent_code(lines, level, False)
 
@@ -16,11 +16,19 @@ Defines the basic data structures and interfaces for the Forte data
 representation system.
 """
 
+import pickle
 from abc import abstractmethod, ABC
-from typing import Iterable, Optional, Set, Type, Hashable, TypeVar, Generic
+from typing import (
+    Any, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set,
+    Type, TypeVar, Generic)
 
 import numpy as np
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from forte.data.container import ContainerType
 
 __all__ = [
@@ -30,8 +38,71 @@ __all__ = [
     "LinkType",
     "GroupType",
     "EntryType",
+    "MISSING",
 ]
 
+# A shared, read-only empty embedding returned for entries that have never
+# been assigned an embedding, so that no array is allocated per entry.
+_EMPTY_EMB: np.ndarray = np.empty(0)
+_EMPTY_EMB.setflags(write=False)
+
+# The members of a new group, shared by the groups until members are added.
+_EMPTY_MEMBERS: np.ndarray = np.empty(0, dtype=np.int64)
+_EMPTY_MEMBERS.setflags(write=False)
+
+# The default value of the arguments of the ``_set_all`` methods generated for
+# the ontology classes, marking the fields that are not set.
+MISSING = object()
+
+# The slots holding the internal states of the entries, which are neither
+# fields nor serialized with the entries. The names are the ones declared in
+# ``__slots__``, i.e., before the private names are mangled.
+_INTERNAL_SLOTS = frozenset(
+    ('_hash', '_members_hash', '_detached_embedding', '__pack',
+     '_pack_id', '_modified_mask', 'index_key'))
+
+# The slots holding the state of the entries which are serialized, but cannot
+# be set as fields, since the hash and the index key of an entry depend on them.
+_NON_FIELD_SLOTS = frozenset(('_tid', '_members'))
+
+# The 64-bit golden ratio constant, used to scramble the integers mixed into
+# the hash values.
+_GOLDEN_RATIO = 0x9E3779B97F4A7C15
+_HASH_MASK = (1 << 63) - 1
+
+
+# The state slot names of each entry type, see :func:`_state_slot_names`.
+_STATE_SLOT_NAMES: Dict[type, FrozenSet[str]] = {}
+
+
+def _state_slot_names(cls: type) -> FrozenSet[str]:
+    r"""Collect the names of the ``__slots__`` declared by ``cls`` and its base
+    classes, which hold the state of the entry, i.e., except the internal ones.
+    """
+    try:
+        return _STATE_SLOT_NAMES[cls]
+    except KeyError:
+        names: Set[str] = set()
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            names.update((slots,) if isinstance(slots, str) else slots)
+        result = _STATE_SLOT_NAMES[cls] = frozenset(names - _INTERNAL_SLOTS)
+        return result
+
+
+def _decode_embedding(encoded) -> Optional[np.ndarray]:
+    r"""Restore the embedding serialized along with the entry, which is either
+    a list of floats, or a ``(dtype, shape, buffer)`` tuple.
+    """
+    if encoded is None:
+        return None
+    if len(encoded) != 3 or not isinstance(encoded[0], str):
+        # A plain list of floats.
+        return np.array(encoded) if len(encoded) > 0 else None
+    dtype, shape, buffer = encoded
+    # Copy the array out of the (read-only) buffer so that it stays writable.
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape).copy()
+
 
 class Entry(Generic[ContainerType]):
     r"""The base class inherited by all NLP entries. This is the main data type
@@ -52,18 +123,37 @@ class Entry(Generic[ContainerType]):
 
     Attributes:
         self.embedding: The embedding vectors (numpy array of floats) of this
-            entry.
+            entry. The embeddings are stored by the pack, see
+            :meth:`~forte.data.container.EntryContainer.embeddings_matrix`.
+        self.index_key: The key of this entry in the indices of the pack,
+            which is the tid of the entry.
 
     Args:
         pack: Each entry should be associated with one pack upon creation.
     """
+    __slots__ = ('_tid', '_hash', '_detached_embedding', '__pack',
+                 '_pack_id', '_modified_mask', 'index_key')
+
+    # The field names of each entry type, cached on the class by
+    # :meth:`_field_names`.
+    _field_names_cache: ClassVar[FrozenSet[str]]
+
+    # The bit index of each field in the mask of the modified fields, and the
+    # field names in the order of the indices, created on the class by
+    # :meth:`_field_index`.
+    _FIELD_INDEX: ClassVar[Dict[str, int]]
+    _FIELD_NAMES: ClassVar[List[str]]
 
     def __init__(self, pack: ContainerType):
         super().__init__()
 
         self._tid: int = pack.get_next_id()
-
-        self._embedding: np.ndarray = np.empty(0)
+        self._init_hash()
+        # The key of this entry in the pack indices, which is its tid.
+        self.index_key: int = self._tid
+        # The embedding restored with this entry before it is attached to a
+        # pack, see :meth:`set_pack`.
+        self._detached_embedding: Optional[np.ndarray] = None
 
         # The Entry should have a reference to the data pack, and the data pack
         # need to store the entries. In order to resolve the cyclic references,
@@ -71,23 +161,42 @@ class Entry(Generic[ContainerType]):
         # the actual. Whether this entry can be added to the pack is delegated
         # to be checked by the pack.
         self.__pack: ContainerType = pack
-        self.__field_modified: Set[str] = set()
-        pack.validate(self)
-
-        self.record_creation()
+        # The pack id, cached by :meth:`pack_id` on the first access, and
+        # cleared by set_pack since a deserialized pack is assigned a new id.
+        self._pack_id: Optional[int] = None
+        # The bitmask of the fields modified, indexed by the _FIELD_INDEX.
+        self._modified_mask: int = 0
+
+        # In the bulk mode, the pack validates and records the entries at once.
+        bulk_tids = pack._bulk_tids  # pylint: disable=protected-access
+        if bulk_tids is None:
+            pack.validate(self)
+            self.record_creation()
+        else:
+            bulk_tids.append(self._tid)
+
+    def _init_hash(self):
+        r"""Compute the hash of this entry from its type and tid once, mixing
+        the scrambled tid into the type hash to avoid building a tuple.
+        """
+        self._hash: int = hash(type(self)) ^ (
+            self._tid * _GOLDEN_RATIO & _HASH_MASK)
 
     def record_creation(self):
         self.__pack.add_entry_creation_record(self._tid)
 
     def reset(self):
         """
-        Reset the entry to the empty state.
+        Reset the entry to the empty state: the embedding and the record of
+        the modified fields are cleared. The entry keeps its tid and stays in
+        the pack, so it is not registered again.
 
         Returns:
 
         """
         # TODO: do we need to record this reset action as an edit?
-        self.__init__(self.__pack)
+        self.__pack.delete_embedding(self._tid)
+        self._modified_mask = 0
 
     def __getstate__(self):
         r"""In serialization, the pack is not serialize, and it will be set
@@ -97,39 +206,69 @@ class Entry(Generic[ContainerType]):
         own, without the ``Container`` as the context, there is little semantics
         remained in an entry.
         """
-        state = self.__dict__.copy()
-        # During serialization, convert the numpy array as a list.
-        state["_embedding"] = self._embedding.tolist()
-        state.pop('_Entry__pack')
-        state.pop('_Entry__field_modified')
+        # The attributes of the sub-classes (if any) are stored in the
+        # __dict__, while the attributes declared here are stored in slots.
+        # NOTE: the __dict__ is copied since the sub-classes rename the keys
+        #  of the state in place.
+        state = getattr(self, '__dict__', {}).copy()
+        for name in _state_slot_names(type(self)):
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                # The slot is not set.
+                pass
+        # The embedding is serialized by the pack, unless the entry is not
+        # attached to one yet.
+        detached = getattr(self, '_detached_embedding', None)
+        if detached is not None:
+            state['_embedding'] = (
+                detached.dtype.str, list(detached.shape), detached.tobytes())
         return state
 
     def __setstate__(self, state):
-        # Recover the internal __field_modified dict for the entry.
+        # Recover the internal mask of the modified fields for the entry.
         # NOTE: the __pack will be set via set_pack from the Pack side.
-        self.__dict__['_Entry__field_modified'] = set()
-        # During de-serialization, convert the list back to numpy array.
-        state["_embedding"] = np.array(state["_embedding"])
-        self.__dict__.update(state)
+        self._modified_mask = 0
+        # The embedding serialized along with the entry (e.g. by earlier
+        # versions) is kept until the entry is attached to a pack.
+        self._detached_embedding = _decode_embedding(
+            state.pop("_embedding", None))
+
+        slots = _state_slot_names(type(self))
+        for name, value in state.items():
+            if name in slots:
+                setattr(self, name, value)
+            else:
+                self.__dict__[name] = value
+
+        # The hash of the type differs across processes, so it is recomputed.
+        self._init_hash()
+        self.index_key = self._tid
 
     # using property decorator
-    # a getter function for self._embedding
+    # a getter function for the embedding stored in the pack
     @property
-    def embedding(self):
-        r"""Get the embedding vectors (numpy array of floats) of the entry.
+    def embedding(self) -> np.ndarray:
+        r"""Get the embedding vectors (numpy array of floats) of the entry,
+        which is read-only, use the setter to change the embedding. An empty
+        array is returned if the embedding is not set.
         """
-        return self._embedding
+        embedding = self.__pack.get_embedding(self._tid)
+        if embedding is None:
+            return _EMPTY_EMB
+        return embedding
 
-    # a setter function for self._embedding
+    # a setter function for the embedding stored in the pack
     @embedding.setter
     def embedding(self, embed):
-        r"""Set the embedding vectors of the entry.
+        r"""Set the embedding vectors of the entry. The values are copied into
+        the embedding storage of the pack.
 
         Args:
             embed: The embedding vectors which can be numpy array of floats or
                 list of floats.
         """
-        self._embedding = np.array(embed)
+        self.__pack.set_embedding(self._tid, embed)
 
     @property
     def tid(self) -> int:
@@ -153,10 +292,85 @@ class Entry(Generic[ContainerType]):
         Returns:
 
         """
-        return self.__pack.meta.pack_id  # type: ignore
+        if self._pack_id is None:
+            self._pack_id = self.__pack.meta.pack_id  # type: ignore
+        return self._pack_id
 
     def set_pack(self, pack: ContainerType):
         self.__pack = pack
+        self._pack_id = None
+
+        # Move the embedding restored with this entry to the pack storage.
+        embedding = getattr(self, '_detached_embedding', None)
+        if embedding is not None:
+            pack.set_embedding(self._tid, embedding)
+            self._detached_embedding = None
+
+    def to_msgpack(self) -> bytes:
+        r"""Serialize the tid and the embedding of this entry into a compact
+        buffer, where the embedding is stored as raw bytes along with its data
+        type and shape. The buffer is packed with ``msgpack`` if it is
+        installed, or with ``pickle`` otherwise, so both sides exchanging the
+        buffers should have the same setup.
+
+        Returns:
+            The buffer, which can be restored by :meth:`from_msgpack`.
+        """
+        embedding = getattr(self, '_detached_embedding', None)
+        if embedding is None:
+            embedding = self.__pack.get_embedding(self._tid)
+
+        if embedding is None:
+            payload = [self._tid, '', [], b'']
+        else:
+            embedding = np.ascontiguousarray(embedding)
+            payload = [self._tid, embedding.dtype.str, list(embedding.shape),
+                       embedding.tobytes()]
+
+        if msgpack is not None:
+            return msgpack.packb(payload, use_bin_type=True)
+        return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def from_msgpack(buffer: bytes, pack: ContainerType) -> "Entry":
+        r"""Restore the embedding serialized by :meth:`to_msgpack` to the
+        corresponding entry in ``pack``.
+
+        Args:
+            buffer: The buffer returned by :meth:`to_msgpack`.
+            pack: The pack containing the entry.
+
+        Returns:
+            The entry whose embedding is restored.
+        """
+        if msgpack is not None:
+            payload = msgpack.unpackb(buffer, raw=False)
+        else:
+            payload = pickle.loads(buffer)
+        tid, dtype, shape, data = payload
+
+        entry = pack.get_entry(tid)
+        if dtype:
+            pack.set_embedding(tid, _decode_embedding((dtype, shape, data)))
+        else:
+            pack.delete_embedding(tid)
+        return entry
+
+    def _field_names(self) -> FrozenSet[str]:
+        r"""Get the names of the fields of this entry type. The names are
+        collected from the attributes of the first instance asking for it, and
+        then cached on the class.
+        """
+        cls = type(self)
+        try:
+            return cls.__dict__['_field_names_cache']
+        except KeyError:
+            # NOTE: only the attributes are collected, the functions, setters
+            #  and getters of the class are not fields.
+            names = frozenset(getattr(self, '__dict__', ())).union(
+                _state_slot_names(cls)) - _NON_FIELD_SLOTS
+            setattr(cls, '_field_names_cache', names)
+            return names
 
     def set_fields(self, **kwargs):
         r"""Set the entry fields from the kwargs.
@@ -166,23 +380,79 @@ class Entry(Generic[ContainerType]):
             must be correspond to a field name of this entry, and a value must
             match the field's type.
         """
+        if type(self)._set_all is Entry._set_all:
+            # The fields of the classes not generated from an ontology are
+            # set by the generic loop directly.
+            self._set_fields_generic(kwargs)
+        else:
+            self._set_all(**kwargs)
+
+    def _set_all(self, **kwargs):
+        r"""Set the entry fields from the kwargs. The generated ontology
+        classes override it with the keyword arguments of their own fields,
+        and pass the other fields on to this method.
+        """
+        self._set_fields_generic(kwargs)
+
+    def _set_fields_generic(self, kwargs: Dict[str, Any]):
+        r"""The generic implementation of :meth:`set_fields`, which looks up
+        the fields by their names.
+        """
+        field_names = self._field_names()
         for field_name, field_value in kwargs.items():
-            if field_name in vars(self):
-                # NOTE: hasattr does not work here because it check both
-                #  functions and attributes. We are only interested to see if
-                #  the attributes are there.
-                #  For example, if we use hasattr, is will return True for
-                #  the setter and getter of the attribute name.
-
-                # if hasattr(self, field_name):
+            # The cached names may miss the attributes that are added to this
+            # particular instance later, so we fall back to its own attributes.
+            if field_name in field_names or \
+                    field_name in getattr(self, '__dict__', ()):
                 setattr(self, field_name, field_value)
             else:
                 raise AttributeError(
                     f"The entry type [{self.__class__}] does not have an "
                     f"attribute: '{field_name}'.")
 
-            # We add the record to the system.
-            self.__pack.add_field_record(self.tid, field_name)
+            self._record_field(field_name)
+
+    def _field_index(self, field_name: str) -> int:
+        r"""Get the bit index of the field in the mask of the modified
+        fields. The generated ontology classes declare the indices of their
+        fields in ``_FIELD_INDEX``. For the other entry types, the indices of
+        the parent type are kept, and the other fields of this entry type
+        follow in sorted order. The attributes added to particular instances
+        later are indexed in the order they are seen.
+        """
+        cls = type(self)
+        index = cls.__dict__.get('_FIELD_INDEX')
+        if index is None:
+            inherited = getattr(cls, '_FIELD_NAMES', [])
+            names = inherited + sorted(
+                self._field_names().difference(inherited))
+            index = {name: i for i, name in enumerate(names)}
+            setattr(cls, '_FIELD_INDEX', index)
+            setattr(cls, '_FIELD_NAMES', names)
+        try:
+            return index[field_name]
+        except KeyError:
+            names = self._FIELD_NAMES
+            index[field_name] = len(names)
+            names.append(field_name)
+            return index[field_name]
+
+    def _record_field(self, field_name: str):
+        r"""Mark the field as modified, and add the record to the pack."""
+        self._modified_mask |= 1 << self._field_index(field_name)
+        self.__pack.add_field_record(self._tid, field_name)
+
+    def modified_fields(self) -> Iterator[str]:
+        r"""Iterate over the names of the fields modified (via
+        :meth:`set_fields` or the field setters) since this entry is created
+        or reset, in the order of their indices.
+        """
+        mask = self._modified_mask
+        while mask:
+            # Take the lowest set bit.
+            low = mask & -mask
+            yield self._FIELD_NAMES[low.bit_length() - 1]
+            mask ^= low
 
     def get_field(self, field_name):
         return getattr(self, field_name)
@@ -191,26 +461,29 @@ class Entry(Generic[ContainerType]):
         r"""The eq function for :class:`Entry` objects.
         To be implemented in each subclass.
         """
+        if self is other:
+            return True
         if other is None:
             return False
 
-        return (type(self), self._tid) == (type(other), other.tid)
+        # Entries of the same type share the slot layout, so the tid of the
+        # other entry is loaded from the slot instead of the property.
+        # pylint: disable=protected-access
+        return type(self) is type(other) and self._tid == other._tid
 
     def __hash__(self) -> int:
         r"""The hash function for :class:`Entry` objects.
         To be implemented in each subclass.
         """
-        return hash((type(self), self._tid))
-
-    @property
-    def index_key(self) -> Hashable:
-        return self._tid
+        return self._hash
 
 
 EntryType = TypeVar("EntryType", bound=Entry)
 
 
 class BaseLink(Entry, ABC):
+    __slots__ = ()
+
     def __init__(
             self,
             pack: ContainerType,
@@ -273,10 +546,6 @@ class BaseLink(Entry, ABC):
     def __hash__(self):
         return hash((type(self), self.get_parent(), self.get_child()))
 
-    @property
-    def index_key(self) -> int:
-        return self.tid
-
 
 class BaseGroup(Entry, Generic[EntryType]):
     r"""Group is an entry that represent a group of other entries. For example,
@@ -286,6 +555,8 @@ class BaseGroup(Entry, Generic[EntryType]):
     This is the :class:`BaseGroup` interface. Specific member constraints are
     defined in the inherited classes.
     """
+    __slots__ = ('_members', '_members_hash')
+
     MemberType: Type[EntryType]
 
     def __init__(
@@ -295,11 +566,25 @@ class BaseGroup(Entry, Generic[EntryType]):
     ):
         super().__init__(pack)
 
-        # Store the group member's id.
-        self._members: Set[int] = set()
+        # Store the group member's id, as a sorted array without duplicates.
+        self._members: np.ndarray = _EMPTY_MEMBERS
+        # The hash of the members, computed when needed.
+        self._members_hash: Optional[int] = None
         if members is not None:
             self.add_members(members)
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_members'] = self._members.tolist()
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # The members may be serialized as a set by earlier versions.
+        self._members = np.unique(
+            np.fromiter(self._members, dtype=np.int64))
+        self._members_hash = None
+
     def add_member(self, member: EntryType):
         r"""Add one entry to the group.
 
@@ -314,20 +599,38 @@ class BaseGroup(Entry, Generic[EntryType]):
         Args:
             members: An iterator of members to be added to the group.
         """
-        for member in members:
-            if not isinstance(member, self.MemberType):
-                raise TypeError(
-                    f"The members of {type(self)} should be "
-                    f"instances of {self.MemberType}, but got {type(member)}")
-
-            self._members.add(member.tid)
+        members = list(members)
+        if len(members) == 0:
+            return
+
+        member_type = self.MemberType
+        invalid = next(
+            (m for m in members if not isinstance(m, member_type)), None)
+        if invalid is not None:
+            raise TypeError(
+                f"The members of {type(self)} should be "
+                f"instances of {member_type}, but got {type(invalid)}")
+
+        self._members = np.union1d(self._members, np.fromiter(
+            (m.tid for m in members), dtype=np.int64, count=len(members)))
+        self._members_hash = None
 
     @property
-    def members(self):
-        r"""A list of member tids. To get the member objects, call
-        :meth:`get_members` instead.
+    def members(self) -> FrozenSet[int]:
+        r"""A frozen set of the member tids. To get the member objects,
+        call :meth:`get_members` instead.
         """
-        return self._members
+        return frozenset(self._members.tolist())
+
+    def has_member(self, tid: int) -> bool:
+        r"""Check whether the entry ``tid`` is a member of the group.
+
+        Args:
+            tid: The tid of the entry.
+        """
+        index = np.searchsorted(self._members, tid)
+        return bool(index < len(self._members) and
+                    self._members[index] == tid)
 
     def __hash__(self):
         r"""The hash function of :class:`Group`.
@@ -335,7 +638,11 @@ class BaseGroup(Entry, Generic[EntryType]):
         Users can define their own hash function by themselves but this must
         be consistent to :meth:`eq`.
         """
-        return hash((type(self), tuple(self.members)))
+        if self._members_hash is None:
+            # The members are sorted, so the hash does not depend on the
+            # order they are added.
+            self._members_hash = hash(self._members.tobytes())
+        return hash(type(self)) ^ self._members_hash
 
     def __eq__(self, other):
         r"""The eq function of :class:`Group`. By default, :class:`Group`
@@ -345,9 +652,13 @@ class BaseGroup(Entry, Generic[EntryType]):
         Users can define their own eq function by themselves but this must
         be consistent to :meth:`hash`.
         """
+        if self is other:
+            return True
         if other is None:
             return False
-        return (type(self), self.members) == (type(other), other.members)
+        # pylint: disable=protected-access
+        return type(self) is type(other) and \
+            np.array_equal(self._members, other._members)
 
     def get_members(self):
         r"""Get the member entries in the group.
@@ -359,14 +670,7 @@ class BaseGroup(Entry, Generic[EntryType]):
         if self.pack is None:
             raise ValueError(f"Cannot get members because group is not "
                              f"attached to any data pack.")
-        member_entries = set()
-        for m in self.members:
-            member_entries.add(self.pack.get_entry(m))
-        return member_entries
-
-    @property
-    def index_key(self) -> int:
-        return self.tid
+        return set(self.pack.get_entries_by_ids(self._members.tolist()))
 
 
 GroupType = TypeVar("GroupType", bound=BaseGroup)
@@ -35,6 +35,10 @@ REQUIRED_IMPORTS: List[str] = ['typing']
 
 TOP_MOST_MODULE_NAME = 'forte.data.ontology.core'
 
+# The default value of the arguments of the generated `_set_all` methods,
+# marking the fields that are not set.
+MISSING_VALUE_NAME = f'{TOP_MOST_MODULE_NAME}.MISSING'
+
 DEFAULT_CONSTRAINTS_KEYS = {
     "BaseLink": {SchemaKeywords.parent_type: "ParentType",
                  SchemaKeywords.child_type: "ChildType"},
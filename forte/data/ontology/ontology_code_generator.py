@@ -52,7 +52,7 @@ from forte.data.ontology.ontology_code_const import (
     DEFAULT_PREFIX, SchemaKeywords, file_header, NON_COMPOSITES, COMPOSITES,
     ALL_INBUILT_TYPES, TOP_MOST_MODULE_NAME, PACK_TYPE_CLASS_NAME,
     hardcoded_pack_map, SOURCE_JSON_PFX, SOURCE_JSON_SFX, AUTO_GEN_FILENAME,
-    AUTO_DEL_FILENAME)
+    AUTO_DEL_FILENAME, MISSING_VALUE_NAME)
 
 
 # TODO: Causing error in sphinx - fix and uncomment. Current version displays
@@ -201,6 +201,11 @@ class OntologyCodeGenerator:
         # initialize, so they wil be part of the generated class's __init__
         self.base_entry_lookup: Dict[str, str] = {}
 
+        # Mapping from the generated entries to the bit indices of their
+        # fields in the mask of the modified fields. The fields inherited from
+        # the generated ancestors keep the indices of the ancestors.
+        self.entry_field_index: Dict[str, Dict[str, int]] = {}
+
         # Populate the two dictionaries above. And make the classes in the base
         # ontology aware to the root manager.
         self.initialize_top_entries(self.import_managers.root,
@@ -806,6 +811,20 @@ class OntologyCodeGenerator:
             property_items.append(
                 self.parse_property(entry_name, prop_schema))
 
+        # The sentinel used by the specialized field setter of the entry.
+        missing_value: Optional[str] = None
+        if len(property_items) > 0:
+            this_manager.add_object_to_import(MISSING_VALUE_NAME)
+            missing_value = this_manager.get_name_to_use(MISSING_VALUE_NAME)
+
+        # The fields of this entry are indexed after the ones of its
+        # generated ancestors, in sorted order.
+        field_index: Dict[str, int] = dict(
+            self.entry_field_index.get(parent_entry, {}))
+        for field_name in sorted(p.field_name for p in property_items):
+            field_index.setdefault(field_name, len(field_index))
+        self.entry_field_index[entry_name.class_name] = field_index
+
         # For special classes that requires a constraint.
         core_bases: Set[str] = self.top_to_core_entries[base_entry]
         entry_constraint_keys: Dict[str, str] = {}
@@ -832,7 +851,9 @@ class OntologyCodeGenerator:
             init_args=custom_init_arg_str,
             properties=property_items,
             class_attributes=class_att_items,
-            description=schema.get(SchemaKeywords.description, None))
+            description=schema.get(SchemaKeywords.description, None),
+            missing_value=missing_value,
+            field_index=field_index)
 
         return entry_item, property_names
 
@@ -124,10 +124,6 @@ class Annotation(Entry):
                              f"attached to any data pack.")
         return self.pack.get_span_text(self.span)
 
-    @property
-    def index_key(self) -> int:
-        return self.tid
-
 
 class Link(BaseLink):
     r"""Link type entries, such as "predicate link". Each link has a parent node
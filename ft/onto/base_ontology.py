@@ -10,6 +10,7 @@ Automatically generated ontology base_ontology. Do not change manually.
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.core import Entry
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.top import Group
 from forte.data.ontology.top import Link
@@ -54,6 +55,19 @@ class Token(Annotation):
         _ud_features (Optional[Dict[str, str]])
         _ud_misc (Optional[Dict[str, str]])
     """
+    _FIELD_INDEX = {
+        '_chunk': 0,
+        '_is_root': 1,
+        '_lemma': 2,
+        '_ner': 3,
+        '_pos': 4,
+        '_sense': 5,
+        '_ud_features': 6,
+        '_ud_misc': 7,
+        '_ud_xpos': 8,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._pos: Optional[str] = None
@@ -91,13 +105,64 @@ class Token(Annotation):
         self._ud_features = state.get('ud_features', None) 
         self._ud_misc = state.get('ud_misc', None) 
 
+    def _set_all(
+            self, *,
+            _pos=MISSING,
+            _ud_xpos=MISSING,
+            _lemma=MISSING,
+            _chunk=MISSING,
+            _ner=MISSING,
+            _sense=MISSING,
+            _is_root=MISSING,
+            _ud_features=MISSING,
+            _ud_misc=MISSING,
+            **kwargs):
+        if _pos is not MISSING:
+            self._pos = _pos
+            self._modified_mask |= 1 << 4
+            self.pack.add_field_record(self._tid, '_pos')
+        if _ud_xpos is not MISSING:
+            self._ud_xpos = _ud_xpos
+            self._modified_mask |= 1 << 8
+            self.pack.add_field_record(self._tid, '_ud_xpos')
+        if _lemma is not MISSING:
+            self._lemma = _lemma
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_lemma')
+        if _chunk is not MISSING:
+            self._chunk = _chunk
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_chunk')
+        if _ner is not MISSING:
+            self._ner = _ner
+            self._modified_mask |= 1 << 3
+            self.pack.add_field_record(self._tid, '_ner')
+        if _sense is not MISSING:
+            self._sense = _sense
+            self._modified_mask |= 1 << 5
+            self.pack.add_field_record(self._tid, '_sense')
+        if _is_root is not MISSING:
+            self._is_root = _is_root
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_is_root')
+        if _ud_features is not MISSING:
+            self._ud_features = _ud_features
+            self._modified_mask |= 1 << 6
+            self.pack.add_field_record(self._tid, '_ud_features')
+        if _ud_misc is not MISSING:
+            self._ud_misc = _ud_misc
+            self._modified_mask |= 1 << 7
+            self.pack.add_field_record(self._tid, '_ud_misc')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def pos(self):
         return self._pos
 
     @pos.setter
     def pos(self, pos: Optional[str]):
-        self.set_fields(_pos=pos)
+        self._set_all(_pos=pos)
 
     @property
     def ud_xpos(self):
@@ -105,7 +170,7 @@ class Token(Annotation):
 
     @ud_xpos.setter
     def ud_xpos(self, ud_xpos: Optional[str]):
-        self.set_fields(_ud_xpos=ud_xpos)
+        self._set_all(_ud_xpos=ud_xpos)
 
     @property
     def lemma(self):
@@ -113,7 +178,7 @@ class Token(Annotation):
 
     @lemma.setter
     def lemma(self, lemma: Optional[str]):
-        self.set_fields(_lemma=lemma)
+        self._set_all(_lemma=lemma)
 
     @property
     def chunk(self):
@@ -121,7 +186,7 @@ class Token(Annotation):
 
     @chunk.setter
     def chunk(self, chunk: Optional[str]):
-        self.set_fields(_chunk=chunk)
+        self._set_all(_chunk=chunk)
 
     @property
     def ner(self):
@@ -129,7 +194,7 @@ class Token(Annotation):
 
     @ner.setter
     def ner(self, ner: Optional[str]):
-        self.set_fields(_ner=ner)
+        self._set_all(_ner=ner)
 
     @property
     def sense(self):
@@ -137,7 +202,7 @@ class Token(Annotation):
 
     @sense.setter
     def sense(self, sense: Optional[str]):
-        self.set_fields(_sense=sense)
+        self._set_all(_sense=sense)
 
     @property
     def is_root(self):
@@ -145,7 +210,7 @@ class Token(Annotation):
 
     @is_root.setter
     def is_root(self, is_root: Optional[bool]):
-        self.set_fields(_is_root=is_root)
+        self._set_all(_is_root=is_root)
 
     @property
     def ud_features(self):
@@ -154,7 +219,7 @@ class Token(Annotation):
     @ud_features.setter
     def ud_features(self, ud_features: Optional[Dict[str, str]]):
         ud_features = {} if ud_features is None else ud_features
-        self.set_fields(_ud_features=ud_features)
+        self._set_all(_ud_features=ud_features)
 
     def num_ud_features(self):
         return len(self._ud_features)
@@ -172,7 +237,7 @@ class Token(Annotation):
     @ud_misc.setter
     def ud_misc(self, ud_misc: Optional[Dict[str, str]]):
         ud_misc = {} if ud_misc is None else ud_misc
-        self.set_fields(_ud_misc=ud_misc)
+        self._set_all(_ud_misc=ud_misc)
 
     def num_ud_misc(self):
         return len(self._ud_misc)
@@ -200,6 +265,13 @@ class Sentence(Annotation):
         _part_id (Optional[int])
         _sentiment (Optional[Dict[str, float]])
     """
+    _FIELD_INDEX = {
+        '_part_id': 0,
+        '_sentiment': 1,
+        '_speaker': 2,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._speaker: Optional[str] = None
@@ -219,13 +291,34 @@ class Sentence(Annotation):
         self._part_id = state.get('part_id', None) 
         self._sentiment = state.get('sentiment', None) 
 
+    def _set_all(
+            self, *,
+            _speaker=MISSING,
+            _part_id=MISSING,
+            _sentiment=MISSING,
+            **kwargs):
+        if _speaker is not MISSING:
+            self._speaker = _speaker
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_speaker')
+        if _part_id is not MISSING:
+            self._part_id = _part_id
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_part_id')
+        if _sentiment is not MISSING:
+            self._sentiment = _sentiment
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_sentiment')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def speaker(self):
         return self._speaker
 
     @speaker.setter
     def speaker(self, speaker: Optional[str]):
-        self.set_fields(_speaker=speaker)
+        self._set_all(_speaker=speaker)
 
     @property
     def part_id(self):
@@ -233,7 +326,7 @@ class Sentence(Annotation):
 
     @part_id.setter
     def part_id(self, part_id: Optional[int]):
-        self.set_fields(_part_id=part_id)
+        self._set_all(_part_id=part_id)
 
     @property
     def sentiment(self):
@@ -242,7 +335,7 @@ class Sentence(Annotation):
     @sentiment.setter
     def sentiment(self, sentiment: Optional[Dict[str, float]]):
         sentiment = {} if sentiment is None else sentiment
-        self.set_fields(_sentiment=sentiment)
+        self._set_all(_sentiment=sentiment)
 
     def num_sentiment(self):
         return len(self._sentiment)
@@ -260,6 +353,11 @@ class Phrase(Annotation):
     Attributes:
         _phrase_type (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_phrase_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._phrase_type: Optional[str] = None
@@ -273,13 +371,24 @@ class Phrase(Annotation):
         super().__setstate__(state)
         self._phrase_type = state.get('phrase_type', None) 
 
+    def _set_all(
+            self, *,
+            _phrase_type=MISSING,
+            **kwargs):
+        if _phrase_type is not MISSING:
+            self._phrase_type = _phrase_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_phrase_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def phrase_type(self):
         return self._phrase_type
 
     @phrase_type.setter
     def phrase_type(self, phrase_type: Optional[str]):
-        self.set_fields(_phrase_type=phrase_type)
+        self._set_all(_phrase_type=phrase_type)
 
 
 class Utterance(Annotation):
@@ -298,6 +407,13 @@ class PredicateArgument(Annotation):
         _predicate_lemma (Optional[str])
         _is_verb (Optional[bool])
     """
+    _FIELD_INDEX = {
+        '_is_verb': 0,
+        '_ner_type': 1,
+        '_predicate_lemma': 2,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._ner_type: Optional[str] = None
@@ -317,13 +433,34 @@ class PredicateArgument(Annotation):
         self._predicate_lemma = state.get('predicate_lemma', None) 
         self._is_verb = state.get('is_verb', None) 
 
+    def _set_all(
+            self, *,
+            _ner_type=MISSING,
+            _predicate_lemma=MISSING,
+            _is_verb=MISSING,
+            **kwargs):
+        if _ner_type is not MISSING:
+            self._ner_type = _ner_type
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_ner_type')
+        if _predicate_lemma is not MISSING:
+            self._predicate_lemma = _predicate_lemma
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_predicate_lemma')
+        if _is_verb is not MISSING:
+            self._is_verb = _is_verb
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_is_verb')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def ner_type(self):
         return self._ner_type
 
     @ner_type.setter
     def ner_type(self, ner_type: Optional[str]):
-        self.set_fields(_ner_type=ner_type)
+        self._set_all(_ner_type=ner_type)
 
     @property
     def predicate_lemma(self):
@@ -331,7 +468,7 @@ class PredicateArgument(Annotation):
 
     @predicate_lemma.setter
     def predicate_lemma(self, predicate_lemma: Optional[str]):
-        self.set_fields(_predicate_lemma=predicate_lemma)
+        self._set_all(_predicate_lemma=predicate_lemma)
 
     @property
     def is_verb(self):
@@ -339,7 +476,7 @@ class PredicateArgument(Annotation):
 
     @is_verb.setter
     def is_verb(self, is_verb: Optional[bool]):
-        self.set_fields(_is_verb=is_verb)
+        self._set_all(_is_verb=is_verb)
 
 
 class EntityMention(Annotation):
@@ -348,6 +485,11 @@ class EntityMention(Annotation):
     Attributes:
         _ner_type (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_ner_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._ner_type: Optional[str] = None
@@ -361,13 +503,24 @@ class EntityMention(Annotation):
         super().__setstate__(state)
         self._ner_type = state.get('ner_type', None) 
 
+    def _set_all(
+            self, *,
+            _ner_type=MISSING,
+            **kwargs):
+        if _ner_type is not MISSING:
+            self._ner_type = _ner_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_ner_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def ner_type(self):
         return self._ner_type
 
     @ner_type.setter
     def ner_type(self, ner_type: Optional[str]):
-        self.set_fields(_ner_type=ner_type)
+        self._set_all(_ner_type=ner_type)
 
 
 class EventMention(Annotation):
@@ -376,6 +529,11 @@ class EventMention(Annotation):
     Attributes:
         _event_type (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_event_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._event_type: Optional[str] = None
@@ -389,13 +547,24 @@ class EventMention(Annotation):
         super().__setstate__(state)
         self._event_type = state.get('event_type', None) 
 
+    def _set_all(
+            self, *,
+            _event_type=MISSING,
+            **kwargs):
+        if _event_type is not MISSING:
+            self._event_type = _event_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_event_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def event_type(self):
         return self._event_type
 
     @event_type.setter
     def event_type(self, event_type: Optional[str]):
-        self.set_fields(_event_type=event_type)
+        self._set_all(_event_type=event_type)
 
 
 class PredicateMention(Annotation):
@@ -406,6 +575,13 @@ class PredicateMention(Annotation):
         _framenet_id (Optional[str])
         _is_verb (Optional[bool])
     """
+    _FIELD_INDEX = {
+        '_framenet_id': 0,
+        '_is_verb': 1,
+        '_predicate_lemma': 2,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._predicate_lemma: Optional[str] = None
@@ -425,13 +601,34 @@ class PredicateMention(Annotation):
         self._framenet_id = state.get('framenet_id', None) 
         self._is_verb = state.get('is_verb', None) 
 
+    def _set_all(
+            self, *,
+            _predicate_lemma=MISSING,
+            _framenet_id=MISSING,
+            _is_verb=MISSING,
+            **kwargs):
+        if _predicate_lemma is not MISSING:
+            self._predicate_lemma = _predicate_lemma
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_predicate_lemma')
+        if _framenet_id is not MISSING:
+            self._framenet_id = _framenet_id
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_framenet_id')
+        if _is_verb is not MISSING:
+            self._is_verb = _is_verb
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_is_verb')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def predicate_lemma(self):
         return self._predicate_lemma
 
     @predicate_lemma.setter
     def predicate_lemma(self, predicate_lemma: Optional[str]):
-        self.set_fields(_predicate_lemma=predicate_lemma)
+        self._set_all(_predicate_lemma=predicate_lemma)
 
     @property
     def framenet_id(self):
@@ -439,7 +636,7 @@ class PredicateMention(Annotation):
 
     @framenet_id.setter
     def framenet_id(self, framenet_id: Optional[str]):
-        self.set_fields(_framenet_id=framenet_id)
+        self._set_all(_framenet_id=framenet_id)
 
     @property
     def is_verb(self):
@@ -447,7 +644,7 @@ class PredicateMention(Annotation):
 
     @is_verb.setter
     def is_verb(self, is_verb: Optional[bool]):
-        self.set_fields(_is_verb=is_verb)
+        self._set_all(_is_verb=is_verb)
 
 
 class PredicateLink(Link):
@@ -460,6 +657,11 @@ class PredicateLink(Link):
 
     ChildType = PredicateArgument
 
+    _FIELD_INDEX = {
+        '_arg_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._arg_type: Optional[str] = None
@@ -473,13 +675,24 @@ class PredicateLink(Link):
         super().__setstate__(state)
         self._arg_type = state.get('arg_type', None) 
 
+    def _set_all(
+            self, *,
+            _arg_type=MISSING,
+            **kwargs):
+        if _arg_type is not MISSING:
+            self._arg_type = _arg_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_arg_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def arg_type(self):
         return self._arg_type
 
     @arg_type.setter
     def arg_type(self, arg_type: Optional[str]):
-        self.set_fields(_arg_type=arg_type)
+        self._set_all(_arg_type=arg_type)
 
 
 class Dependency(Link):
@@ -493,6 +706,12 @@ class Dependency(Link):
 
     ChildType = Token
 
+    _FIELD_INDEX = {
+        '_dep_label': 0,
+        '_rel_type': 1,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._dep_label: Optional[str] = None
@@ -509,13 +728,29 @@ class Dependency(Link):
         self._dep_label = state.get('dep_label', None) 
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _dep_label=MISSING,
+            _rel_type=MISSING,
+            **kwargs):
+        if _dep_label is not MISSING:
+            self._dep_label = _dep_label
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_dep_label')
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def dep_label(self):
         return self._dep_label
 
     @dep_label.setter
     def dep_label(self, dep_label: Optional[str]):
-        self.set_fields(_dep_label=dep_label)
+        self._set_all(_dep_label=dep_label)
 
     @property
     def rel_type(self):
@@ -523,7 +758,7 @@ class Dependency(Link):
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
 
 
 class EnhancedDependency(Link):
@@ -537,6 +772,11 @@ class EnhancedDependency(Link):
 
     ChildType = Token
 
+    _FIELD_INDEX = {
+        '_dep_label': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._dep_label: Optional[str] = None
@@ -550,13 +790,24 @@ class EnhancedDependency(Link):
         super().__setstate__(state)
         self._dep_label = state.get('dep_label', None) 
 
+    def _set_all(
+            self, *,
+            _dep_label=MISSING,
+            **kwargs):
+        if _dep_label is not MISSING:
+            self._dep_label = _dep_label
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_dep_label')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def dep_label(self):
         return self._dep_label
 
     @dep_label.setter
     def dep_label(self, dep_label: Optional[str]):
-        self.set_fields(_dep_label=dep_label)
+        self._set_all(_dep_label=dep_label)
 
 
 class RelationLink(Link):
@@ -569,6 +820,11 @@ class RelationLink(Link):
 
     ChildType = EntityMention
 
+    _FIELD_INDEX = {
+        '_rel_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._rel_type: Optional[str] = None
@@ -582,13 +838,24 @@ class RelationLink(Link):
         super().__setstate__(state)
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _rel_type=MISSING,
+            **kwargs):
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def rel_type(self):
         return self._rel_type
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
 
 
 class CrossDocEntityRelation(MultiPackLink):
@@ -601,6 +868,11 @@ class CrossDocEntityRelation(MultiPackLink):
 
     ChildType = EntityMention
 
+    _FIELD_INDEX = {
+        '_rel_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: MultiPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._rel_type: Optional[str] = None
@@ -614,13 +886,24 @@ class CrossDocEntityRelation(MultiPackLink):
         super().__setstate__(state)
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _rel_type=MISSING,
+            **kwargs):
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def rel_type(self):
         return self._rel_type
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
 
 
 class CoreferenceGroup(Group):
@@ -641,6 +924,11 @@ class EventRelation(Link):
 
     ChildType = EventMention
 
+    _FIELD_INDEX = {
+        '_rel_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._rel_type: Optional[str] = None
@@ -654,13 +942,24 @@ class EventRelation(Link):
         super().__setstate__(state)
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _rel_type=MISSING,
+            **kwargs):
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def rel_type(self):
         return self._rel_type
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
 
 
 class CrossDocEventRelation(MultiPackLink):
@@ -673,6 +972,11 @@ class CrossDocEventRelation(MultiPackLink):
 
     ChildType = EventMention
 
+    _FIELD_INDEX = {
+        '_rel_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: MultiPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._rel_type: Optional[str] = None
@@ -686,10 +990,21 @@ class CrossDocEventRelation(MultiPackLink):
         super().__setstate__(state)
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _rel_type=MISSING,
+            **kwargs):
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def rel_type(self):
         return self._rel_type
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
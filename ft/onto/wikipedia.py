@@ -8,6 +8,7 @@ Automatically generated ontology wikipedia. Do not change manually.
 """
 
 from forte.data.data_pack import DataPack
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.top import Generics
 from typing import Optional
@@ -31,6 +32,12 @@ class WikiPage(Annotation):
         _page_id (Optional[str])
         _page_name (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_page_id': 0,
+        '_page_name': 1,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._page_id: Optional[str] = None
@@ -47,13 +54,29 @@ class WikiPage(Annotation):
         self._page_id = state.get('page_id', None) 
         self._page_name = state.get('page_name', None) 
 
+    def _set_all(
+            self, *,
+            _page_id=MISSING,
+            _page_name=MISSING,
+            **kwargs):
+        if _page_id is not MISSING:
+            self._page_id = _page_id
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_page_id')
+        if _page_name is not MISSING:
+            self._page_name = _page_name
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_page_name')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def page_id(self):
         return self._page_id
 
     @page_id.setter
     def page_id(self, page_id: Optional[str]):
-        self.set_fields(_page_id=page_id)
+        self._set_all(_page_id=page_id)
 
     @property
     def page_name(self):
@@ -61,7 +84,7 @@ class WikiPage(Annotation):
 
     @page_name.setter
     def page_name(self, page_name: Optional[str]):
-        self.set_fields(_page_name=page_name)
+        self._set_all(_page_name=page_name)
 
 
 class WikiBody(Annotation):
@@ -74,6 +97,11 @@ class WikiSection(Annotation):
     Attributes:
         _is_intro (Optional[bool])
     """
+    _FIELD_INDEX = {
+        '_is_intro': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._is_intro: Optional[bool] = None
@@ -87,13 +115,24 @@ class WikiSection(Annotation):
         super().__setstate__(state)
         self._is_intro = state.get('is_intro', None) 
 
+    def _set_all(
+            self, *,
+            _is_intro=MISSING,
+            **kwargs):
+        if _is_intro is not MISSING:
+            self._is_intro = _is_intro
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_is_intro')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def is_intro(self):
         return self._is_intro
 
     @is_intro.setter
     def is_intro(self, is_intro: Optional[bool]):
-        self.set_fields(_is_intro=is_intro)
+        self._set_all(_is_intro=is_intro)
 
 
 class WikiParagraph(Annotation):
@@ -111,6 +150,11 @@ class WikiAnchor(Annotation):
     Attributes:
         _target_page_name (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_target_page_name': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._target_page_name: Optional[str] = None
@@ -124,13 +168,24 @@ class WikiAnchor(Annotation):
         super().__setstate__(state)
         self._target_page_name = state.get('target_page_name', None) 
 
+    def _set_all(
+            self, *,
+            _target_page_name=MISSING,
+            **kwargs):
+        if _target_page_name is not MISSING:
+            self._target_page_name = _target_page_name
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_target_page_name')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def target_page_name(self):
         return self._target_page_name
 
     @target_page_name.setter
     def target_page_name(self, target_page_name: Optional[str]):
-        self.set_fields(_target_page_name=target_page_name)
+        self._set_all(_target_page_name=target_page_name)
 
 
 class WikiInfoBoxProperty(Generics):
@@ -139,6 +194,12 @@ class WikiInfoBoxProperty(Generics):
         _key (Optional[str])
         _value (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_key': 0,
+        '_value': 1,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack):
         super().__init__(pack)
         self._key: Optional[str] = None
@@ -155,13 +216,29 @@ class WikiInfoBoxProperty(Generics):
         self._key = state.get('key', None) 
         self._value = state.get('value', None) 
 
+    def _set_all(
+            self, *,
+            _key=MISSING,
+            _value=MISSING,
+            **kwargs):
+        if _key is not MISSING:
+            self._key = _key
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_key')
+        if _value is not MISSING:
+            self._value = _value
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_value')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def key(self):
         return self._key
 
     @key.setter
     def key(self, key: Optional[str]):
-        self.set_fields(_key=key)
+        self._set_all(_key=key)
 
     @property
     def value(self):
@@ -169,7 +246,7 @@ class WikiInfoBoxProperty(Generics):
 
     @value.setter
     def value(self, value: Optional[str]):
-        self.set_fields(_value=value)
+        self._set_all(_value=value)
 
 
 class WikiInfoBoxMapped(Generics):
@@ -178,6 +255,12 @@ class WikiInfoBoxMapped(Generics):
         _key (Optional[str])
         _value (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_key': 0,
+        '_value': 1,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack):
         super().__init__(pack)
         self._key: Optional[str] = None
@@ -194,13 +277,29 @@ class WikiInfoBoxMapped(Generics):
         self._key = state.get('key', None) 
         self._value = state.get('value', None) 
 
+    def _set_all(
+            self, *,
+            _key=MISSING,
+            _value=MISSING,
+            **kwargs):
+        if _key is not MISSING:
+            self._key = _key
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_key')
+        if _value is not MISSING:
+            self._value = _value
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_value')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def key(self):
         return self._key
 
     @key.setter
     def key(self, key: Optional[str]):
-        self.set_fields(_key=key)
+        self._set_all(_key=key)
 
     @property
     def value(self):
@@ -208,4 +307,4 @@ class WikiInfoBoxMapped(Generics):
 
     @value.setter
     def value(self, value: Optional[str]):
-        self.set_fields(_value=value)
+        self._set_all(_value=value)
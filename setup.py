@@ -46,7 +46,9 @@ setuptools.setup(
         'wikipedia': ['rdflib'],
         'ir': ['faiss-cpu>=1.6.1', 'elasticsearch'],
         'spacy': ['spacy>=2.2.3'],
-        'allennlp': ['allennlp']
+        'allennlp': ['allennlp'],
+        'numba': ['numba'],
+        'msgpack': ['msgpack'],
     },
     entry_points={
           'console_scripts': [
@@ -22,6 +22,7 @@ import pickle
 import tempfile
 
 from forte.data.container import EntryContainer
+from forte.data.ontology.top import Generics
 from forte.data.span import Span
 
 
@@ -58,6 +59,12 @@ class EntryContainerTest(unittest.TestCase):
 
         self.assertEqual(container_new.get_next_id(), 1)
 
+    def test_entry(self):
+        container = DummyContainer()
+        entry = Generics(container)
+        self.assertIs(entry.pack, container)
+        self.assertEqual(entry.tid, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
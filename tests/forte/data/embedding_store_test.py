@@ -0,0 +1,163 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit test for EmbeddingStore.
+"""
+
+import unittest
+
+import jsonpickle
+import numpy as np
+
+from forte.data.embedding_store import EmbeddingStore
+
+
+class EmbeddingStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.store = EmbeddingStore()
+        for tid in range(10):
+            self.store.set(tid, np.full(4, tid, dtype=np.float32))
+
+    def test_set_and_get(self):
+        self.assertIsNone(self.store.get(10))
+        np.testing.assert_array_equal(self.store.get(3), [3, 3, 3, 3])
+
+        self.store.set(3, [1, 2, 3, 4])
+        np.testing.assert_array_equal(self.store.get(3), [1, 2, 3, 4])
+
+        matrix = self.store.get_matrix()
+        self.assertEqual(len(matrix), 10)
+        self.assertEqual(matrix.matrix().shape, (10, 4))
+        self.assertEqual(matrix.matrix().dtype, np.float32)
+
+    def test_remove(self):
+        view = self.store.get(6)
+        self.assertFalse(view.flags.writeable)
+        for tid in (0, 4, 5):
+            self.store.remove(tid)
+        self.assertNotIn(4, self.store)
+
+        matrix = self.store.get_matrix()
+        self.assertEqual(matrix.tids(), [1, 2, 3, 6, 7, 8, 9])
+        np.testing.assert_array_equal(
+            matrix.matrix()[:, 0], [1, 2, 3, 6, 7, 8, 9])
+
+        self.store.set(4, np.zeros(4, dtype=np.float32))
+        self.assertEqual(matrix.tids(), [1, 2, 3, 6, 7, 8, 9, 4])
+
+        # The views taken before the compaction keep their own values.
+        np.testing.assert_array_equal(view, [6, 6, 6, 6])
+        np.testing.assert_array_equal(self.store.get(6), [6, 6, 6, 6])
+
+    def test_reuse_removed_rows(self):
+        matrix = self.store.get_matrix()
+        for tid in range(10, 1010):
+            self.store.set(tid, np.full(4, tid, dtype=np.float32))
+            self.store.remove(tid)
+        # pylint: disable=protected-access
+        self.assertLessEqual(matrix._data.shape[0], 32)
+        self.assertEqual(matrix.tids(), list(range(10)))
+        np.testing.assert_array_equal(self.store.get(9), [9, 9, 9, 9])
+
+    def test_drop_empty_matrices(self):
+        store = EmbeddingStore()
+        store.set(0, np.ones(3))
+        store.set(0, np.ones(4))
+        self.assertEqual(store.get_matrix().shape, (4,))
+
+        store.remove(0)
+        with self.assertRaises(ValueError):
+            store.get_matrix()
+
+        store.set(0, np.ones(3))
+        store.remove(0)
+        store.set(1, np.ones(5))
+        self.assertEqual(store.get_matrix().tids(), [1])
+
+    def test_dtype(self):
+        self.assertEqual(EmbeddingStore().dtype, np.float32)
+        with self.assertRaises(ValueError):
+            EmbeddingStore(np.int32)
+
+        rng = np.random.RandomState(0)
+        vectors = rng.randn(10, 4).astype(np.float32)
+        for tid, vector in enumerate(vectors):
+            self.store.set(tid, vector)
+
+        self.store.set_dtype(np.float16)
+        self.assertEqual(self.store.get_matrix().matrix().dtype, np.float16)
+        np.testing.assert_allclose(self.store.get(2), vectors[2], atol=1e-2)
+
+        self.store.set_dtype(np.int8)
+        matrix = self.store.get_matrix()
+        self.assertEqual(matrix.matrix().dtype, np.int8)
+        self.assertEqual(matrix.scales().shape, (10,))
+        np.testing.assert_allclose(self.store.get(2), vectors[2], atol=5e-2)
+        self.assertFalse(self.store.get(2).flags.writeable)
+
+        query = rng.randn(4).astype(np.float32)
+        np.testing.assert_allclose(
+            matrix.dot(query), vectors @ query, atol=1e-1)
+        np.testing.assert_allclose(
+            matrix.dot(vectors[:3].T), vectors @ vectors[:3].T, atol=1e-1)
+
+        self.store.set(20, np.zeros(4))
+        np.testing.assert_array_equal(self.store.get(20), np.zeros(4))
+
+        store: EmbeddingStore = jsonpickle.decode(
+            jsonpickle.encode(self.store))
+        self.assertEqual(store.dtype, np.int8)
+        np.testing.assert_array_equal(store.get(2), self.store.get(2))
+
+    def test_normalize_and_top_k(self):
+        rng = np.random.RandomState(0)
+        vectors = rng.randn(10, 4).astype(np.float32)
+        for tid, vector in enumerate(vectors):
+            self.store.set(tid, vector)
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        query = normalized[[3, 7]]
+        expected = np.argsort(-(normalized @ query.T), axis=0)[:3].T
+
+        for dtype in (np.float32, np.float64, np.float16, np.int8):
+            self.store.set_dtype(dtype)
+            matrix = self.store.get_matrix()
+            matrix.normalize()
+            np.testing.assert_allclose(
+                self.store.get(5), normalized[5], atol=5e-2)
+
+            results = matrix.top_k(query, 3)
+            self.assertEqual(
+                [[tid for tid, _ in result] for result in results],
+                expected.tolist())
+            self.assertAlmostEqual(results[0][0][1], 1, delta=5e-2)
+
+        self.assertEqual(len(matrix.top_k(query, 20)[0]), 10)
+
+    def test_serialization(self):
+        self.store.remove(2)
+        self.store.set(20, np.ones((2, 2)))
+
+        store: EmbeddingStore = jsonpickle.decode(
+            jsonpickle.encode(self.store))
+        self.assertEqual(
+            store.get_matrix((4,)).tids(), [0, 1, 3, 4, 5, 6, 7, 8, 9])
+        np.testing.assert_array_equal(
+            store.get_matrix((4,)).matrix(),
+            self.store.get_matrix((4,)).matrix())
+        np.testing.assert_array_equal(store.get(20), np.ones((2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
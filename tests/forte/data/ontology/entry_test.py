@@ -0,0 +1,284 @@
+# Copyright 2019 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the basic entry operations.
+"""
+import pickle
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from forte.data.data_pack import DataPack
+from forte.data.ontology import core
+from forte.data.ontology.core import Entry
+from forte.data.ontology.top import Generics
+from ft.onto.base_ontology import Token, EntityMention, CoreferenceGroup
+
+
+class EntryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pack = DataPack()
+        self.pack.set_control_component("entry_test")
+        self.pack.set_text("Forte is a toolkit.")
+        self.token = self.pack.add_entry(Token(self.pack, 0, 5))
+
+    def test_embedding(self):
+        self.assertEqual(self.token.embedding.size, 0)
+
+        self.token.embedding = [0.1, 0.2, 0.3]
+        np.testing.assert_array_almost_equal(
+            self.token.embedding, [0.1, 0.2, 0.3])
+
+        pack: DataPack = DataPack.deserialize(self.pack.serialize())
+        token: Token = pack.get_single(Token)
+        np.testing.assert_array_almost_equal(
+            token.embedding, [0.1, 0.2, 0.3])
+
+    def test_embedding_pickle(self):
+        embedding = np.arange(12, dtype=np.float32).reshape(3, 4)
+        self.token.embedding = embedding
+
+        pack: DataPack = pickle.loads(pickle.dumps(self.pack))
+        token: Token = pack.get_single(Token)
+        self.assertEqual(token.embedding.dtype, np.float32)
+        np.testing.assert_array_equal(token.embedding, embedding)
+        self.assertEqual(self.token.pack_id, self.pack.meta.pack_id)
+        # The deserialized pack is assigned a new id.
+        self.assertNotEqual(token.pack_id, self.token.pack_id)
+        self.assertEqual(token.pack_id, pack.meta.pack_id)
+
+        # The embedding serialized along with the entry by earlier versions
+        # is moved to the pack.
+        state = self.token.__getstate__()
+        state["_embedding"] = [0.5, 0.5]
+        token.__setstate__(state)
+        # The detached embedding is encoded as raw bytes.
+        detached_state = token.__getstate__()
+        dtype, shape, _ = detached_state["_embedding"]
+        self.assertEqual((dtype, shape), (np.dtype(np.float64).str, [2]))
+        token.__setstate__(detached_state)
+        token.set_pack(pack)
+        np.testing.assert_array_equal(token.embedding, [0.5, 0.5])
+
+    def test_msgpack(self):
+        embedding = np.arange(6, dtype=np.float16).reshape(2, 3)
+        for module in (core.msgpack, None):
+            with mock.patch.object(core, 'msgpack', module):
+                self.token.embedding = embedding
+                buffer = self.token.to_msgpack()
+                self.token.embedding = np.zeros(4)
+
+                self.assertIs(Entry.from_msgpack(buffer, self.pack), self.token)
+                self.assertEqual(self.token.embedding.dtype, np.float32)
+                np.testing.assert_array_equal(self.token.embedding, embedding)
+
+                self.pack.delete_embedding(self.token.tid)
+                buffer = self.token.to_msgpack()
+                self.token.embedding = embedding
+                Entry.from_msgpack(buffer, self.pack)
+                self.assertEqual(self.token.embedding.size, 0)
+
+    def test_embeddings_matrix(self):
+        tokens = [self.token] + [
+            self.pack.add_entry(Token(self.pack, begin, end))
+            for begin, end in ((6, 8), (9, 10), (11, 18))]
+        for i, token in enumerate(tokens):
+            token.embedding = np.full(3, i, dtype=np.float32)
+
+        self.assertEqual(
+            self.pack.embedding_tids(), [token.tid for token in tokens])
+        np.testing.assert_array_equal(
+            self.pack.embeddings_matrix()[:, 0], [0, 1, 2, 3])
+
+        tokens[1].embedding = np.full(3, 5, dtype=np.float32)
+        self.pack.delete_entry(tokens[2])
+        self.assertEqual(tokens[2].embedding.size, 0)
+        self.assertEqual(
+            self.pack.embedding_tids(),
+            [tokens[0].tid, tokens[1].tid, tokens[3].tid])
+        np.testing.assert_array_equal(
+            self.pack.embeddings_matrix()[:, 0], [0, 5, 3])
+
+        self.pack.normalize_embeddings()
+        np.testing.assert_array_almost_equal(
+            tokens[1].embedding, np.full(3, 1 / np.sqrt(3)))
+        self.assertEqual(
+            {tid for tid, _ in self.pack.top_k_similar(np.ones(3), k=2)},
+            {tokens[1].tid, tokens[3].tid})
+
+        # Embeddings of different shapes are stored separately.
+        tokens[0].embedding = np.zeros((2, 3), dtype=np.float32)
+        with self.assertRaises(ValueError):
+            self.pack.embeddings_matrix()
+        self.assertEqual(self.pack.embedding_tids((2, 3)), [tokens[0].tid])
+        self.assertEqual(
+            self.pack.embedding_tids((3,)), [tokens[1].tid, tokens[3].tid])
+
+    def test_reset(self):
+        tid = self.token.tid
+        self.token.embedding = [0.1, 0.2, 0.3]
+        self.token.lemma = "forte"
+        self.token.reset()
+        self.assertEqual(list(self.token.modified_fields()), [])
+        self.assertEqual(self.token.tid, tid)
+        self.assertEqual(self.token.embedding.size, 0)
+        self.assertIs(self.pack.get_entry(tid), self.token)
+
+    def test_hash_eq(self):
+        generics_1 = self.pack.add_entry(Generics(self.pack))
+        generics_2 = self.pack.add_entry(Generics(self.pack))
+        self.assertNotEqual(generics_1, generics_2)
+        self.assertNotEqual(generics_1, None)
+        self.assertEqual(len({generics_1, generics_2, generics_1}), 2)
+
+        pack: DataPack = pickle.loads(pickle.dumps(self.pack))
+        new_generics = pack.generics[0]
+        self.assertEqual(new_generics.tid, generics_1.tid)
+        self.assertEqual(hash(new_generics), hash(generics_1))
+        self.assertEqual(new_generics, generics_1)
+        self.assertEqual(new_generics.index_key, generics_1.tid)
+        self.assertNotIn("index_key", generics_1.__getstate__())
+
+    def test_group_hash_eq(self):
+        mentions = [
+            self.pack.add_entry(EntityMention(self.pack, begin, end))
+            for begin, end in ((0, 5), (6, 8), (11, 18))]
+        group_1 = self.pack.add_entry(CoreferenceGroup(self.pack, mentions))
+        group_2 = CoreferenceGroup(self.pack, mentions[::-1])
+        self.assertEqual(group_1, group_2)
+        self.assertEqual(hash(group_1), hash(group_2))
+
+        group_2.add_member(mentions[0])
+        self.assertEqual(hash(group_1), hash(group_2))
+
+        group_3 = CoreferenceGroup(self.pack, mentions[:2])
+        self.assertNotEqual(group_1, group_3)
+        group_3.add_member(mentions[2])
+        self.assertEqual(group_1, group_3)
+        self.assertEqual(hash(group_1), hash(group_3))
+
+        self.assertEqual(group_1.get_members(), set(mentions))
+        self.assertEqual(
+            self.pack.get_entries_by_ids([mentions[2].tid, mentions[0].tid]),
+            [mentions[2], mentions[0]])
+        with self.assertRaises(KeyError):
+            self.pack.get_entries_by_ids([group_2.tid])
+
+        self.assertEqual(group_1.members, {m.tid for m in mentions})
+        self.assertTrue(group_1.has_member(mentions[1].tid))
+        with self.assertRaises(TypeError):
+            group_1.add_members([mentions[0], "Forte"])
+        self.assertEqual(group_1.members, {m.tid for m in mentions})
+        self.assertFalse(group_1.has_member(group_1.tid))
+        # The members identify the group, they are not a field.
+        with self.assertRaises(AttributeError):
+            group_1.set_fields(_members=[mentions[0].tid])
+        self.assertIsInstance(group_1.members, frozenset)
+
+        pack: DataPack = DataPack.deserialize(self.pack.serialize())
+        self.assertEqual(hash(pack.get_entry(group_1.tid)), hash(group_1))
+
+    def test_set_fields(self):
+        self.token.set_fields(_pos="NNP", _lemma="forte")
+        self.assertEqual(self.token.pos, "NNP")
+        self.assertEqual(self.token.lemma, "forte")
+
+        token = self.pack.add_entry(Token(self.pack, 6, 8))
+        token.pos = "VBZ"
+        self.assertEqual(token.pos, "VBZ")
+        self.assertEqual(
+            self.pack.field_records["entry_test"],
+            {(self.token.tid, "_pos"), (self.token.tid, "_lemma"),
+             (token.tid, "_pos")})
+
+        # The fields not declared by Token are set by the generic method.
+        token.set_fields(_ner="ORG", _span=token.span)
+        self.assertEqual(token.ner, "ORG")
+        self.assertIn(
+            (token.tid, "_span"), self.pack.field_records["entry_test"])
+
+        self.assertEqual(
+            list(self.token.modified_fields()), ["_lemma", "_pos"])
+        self.assertEqual(
+            list(token.modified_fields()), ["_ner", "_pos", "_span"])
+
+        # The attributes added to an instance are tracked as well.
+        token.__dict__["_note"] = None
+        token.set_fields(_note="verb")
+        self.assertEqual(
+            list(token.modified_fields()), ["_ner", "_pos", "_span", "_note"])
+
+        with self.assertRaises(AttributeError):
+            token.set_fields(pos_tag="VBZ")
+        # The tid identifies the entry, it is not a field.
+        with self.assertRaises(AttributeError):
+            token.set_fields(_tid=token.tid + 1)
+
+    def test_field_index_inheritance(self):
+        class SubToken(Token):
+            pass
+
+        # The bits of the fields of Token are kept by the derived types.
+        token = self.pack.add_entry(SubToken(self.pack, 6, 8))
+        token.set_fields(_pos="VBZ", _span=token.span)
+        token.lemma = "be"
+        self.assertEqual(
+            SubToken._FIELD_NAMES[:len(Token._FIELD_INDEX)],
+            list(Token._FIELD_INDEX))
+        self.assertEqual(
+            list(token.modified_fields()), ["_lemma", "_pos", "_span"])
+
+    def test_bulk_create_entries(self):
+        spans = [(6, 8), (9, 10), (11, 18)]
+        tokens = self.pack.bulk_create_entries(
+            Token, ({"begin": begin, "end": end} for begin, end in spans))
+        self.assertEqual(
+            [(token.begin, token.end) for token in tokens], spans)
+        self.assertEqual(
+            self.pack.creation_records["entry_test"],
+            {self.token.tid} | {token.tid for token in tokens})
+        self.assertEqual(len(list(self.pack.get(Token))), 4)
+
+        # The validation is not enforced, as for the entries created alone.
+        with mock.patch.object(self.pack, "validate", return_value=False):
+            tokens = self.pack.bulk_create_entries(
+                Token, [{"begin": 0, "end": 5}])
+        self.assertIn(tokens[0].tid, self.pack.creation_records["entry_test"])
+
+        self.assertEqual(self.pack.bulk_create_entries(Token, []), [])
+        with self.assertRaises(TypeError):
+            self.pack.bulk_create_entries(Token, [{"start": 0, "end": 5}])
+        # The pack leaves the bulk mode after a failure.
+        token = self.pack.add_entry(Token(self.pack, 0, 5))
+        self.assertIn(token.tid, self.pack.creation_records["entry_test"])
+
+    def test_group_serialization(self):
+        mention_1 = self.pack.add_entry(EntityMention(self.pack, 0, 5))
+        mention_2 = self.pack.add_entry(EntityMention(self.pack, 11, 18))
+        group = self.pack.add_entry(
+            CoreferenceGroup(self.pack, [mention_1, mention_2]))
+
+        pack: DataPack = DataPack.deserialize(self.pack.serialize())
+        new_group: CoreferenceGroup = pack.get_single(CoreferenceGroup)
+        self.assertEqual(new_group.tid, group.tid)
+        self.assertEqual(new_group.members, group.members)
+        self.assertEqual(
+            sorted(m.text for m in new_group.get_members()),
+            ["Forte", "toolkit"])
+
+
+if __name__ == '__main__':
+    unittest.main()
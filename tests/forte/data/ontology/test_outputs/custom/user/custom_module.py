@@ -9,6 +9,7 @@ Automatically generated ontology example_multi_module_ontology. Do not change ma
 
 from forte.data.data_pack import DataPack
 from forte.data.ontology.core import Entry
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Link
 from ft.onto.ft_module import Token
 from typing import Optional
@@ -28,6 +29,11 @@ class Dependency(Link):
 
     ChildType = Token
 
+    _FIELD_INDEX = {
+        '_rel_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._rel_type: Optional[str] = None
@@ -41,10 +47,21 @@ class Dependency(Link):
         super().__setstate__(state)
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _rel_type=MISSING,
+            **kwargs):
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def rel_type(self):
         return self._rel_type
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
@@ -9,6 +9,7 @@ Automatically generated ontology example_complex_ontology. Do not change manuall
 
 from forte.data.data_pack import DataPack
 from forte.data.ontology.core import Entry
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.top import Link
 from typing import List
@@ -31,6 +32,14 @@ class Token(Annotation):
         _num_chars (Optional[int])
         _score (Optional[float])
     """
+    _FIELD_INDEX = {
+        '_is_verb': 0,
+        '_lemma': 1,
+        '_num_chars': 2,
+        '_score': 3,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._lemma: Optional[str] = None
@@ -53,13 +62,39 @@ class Token(Annotation):
         self._num_chars = state.get('num_chars', None) 
         self._score = state.get('score', None) 
 
+    def _set_all(
+            self, *,
+            _lemma=MISSING,
+            _is_verb=MISSING,
+            _num_chars=MISSING,
+            _score=MISSING,
+            **kwargs):
+        if _lemma is not MISSING:
+            self._lemma = _lemma
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_lemma')
+        if _is_verb is not MISSING:
+            self._is_verb = _is_verb
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_is_verb')
+        if _num_chars is not MISSING:
+            self._num_chars = _num_chars
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_num_chars')
+        if _score is not MISSING:
+            self._score = _score
+            self._modified_mask |= 1 << 3
+            self.pack.add_field_record(self._tid, '_score')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def lemma(self):
         return self._lemma
 
     @lemma.setter
     def lemma(self, lemma: Optional[str]):
-        self.set_fields(_lemma=lemma)
+        self._set_all(_lemma=lemma)
 
     @property
     def is_verb(self):
@@ -67,7 +102,7 @@ class Token(Annotation):
 
     @is_verb.setter
     def is_verb(self, is_verb: Optional[bool]):
-        self.set_fields(_is_verb=is_verb)
+        self._set_all(_is_verb=is_verb)
 
     @property
     def num_chars(self):
@@ -75,7 +110,7 @@ class Token(Annotation):
 
     @num_chars.setter
     def num_chars(self, num_chars: Optional[int]):
-        self.set_fields(_num_chars=num_chars)
+        self._set_all(_num_chars=num_chars)
 
     @property
     def score(self):
@@ -83,7 +118,7 @@ class Token(Annotation):
 
     @score.setter
     def score(self, score: Optional[float]):
-        self.set_fields(_score=score)
+        self._set_all(_score=score)
 
 
 class Sentence(Annotation):
@@ -91,6 +126,11 @@ class Sentence(Annotation):
     Attributes:
         _key_tokens (Optional[List[int]])
     """
+    _FIELD_INDEX = {
+        '_key_tokens': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._key_tokens: Optional[List[int]] = []
@@ -104,6 +144,17 @@ class Sentence(Annotation):
         super().__setstate__(state)
         self._key_tokens = state.get('key_tokens', None) 
 
+    def _set_all(
+            self, *,
+            _key_tokens=MISSING,
+            **kwargs):
+        if _key_tokens is not MISSING:
+            self._key_tokens = _key_tokens
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_key_tokens')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def key_tokens(self):
         return [self.pack.get_entry(tid) for tid in self._key_tokens]
@@ -111,7 +162,7 @@ class Sentence(Annotation):
     @key_tokens.setter
     def key_tokens(self, key_tokens: Optional[List[Token]]):
         key_tokens = [] if key_tokens is None else key_tokens
-        self.set_fields(_key_tokens=[self.pack.add_entry_(obj) for obj in key_tokens])
+        self._set_all(_key_tokens=[self.pack.add_entry_(obj) for obj in key_tokens])
 
     def num_key_tokens(self):
         return len(self._key_tokens)
@@ -134,6 +185,11 @@ class Dependency(Link):
     Attributes:
         _rel_type (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_rel_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._rel_type: Optional[str] = None
@@ -147,10 +203,21 @@ class Dependency(Link):
         super().__setstate__(state)
         self._rel_type = state.get('rel_type', None) 
 
+    def _set_all(
+            self, *,
+            _rel_type=MISSING,
+            **kwargs):
+        if _rel_type is not MISSING:
+            self._rel_type = _rel_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_rel_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def rel_type(self):
         return self._rel_type
 
     @rel_type.setter
     def rel_type(self, rel_type: Optional[str]):
-        self.set_fields(_rel_type=rel_type)
+        self._set_all(_rel_type=rel_type)
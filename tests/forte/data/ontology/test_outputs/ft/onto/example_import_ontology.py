@@ -8,6 +8,7 @@ Automatically generated ontology example_import_ontology. Do not change manually
 """
 
 from forte.data.data_pack import DataPack
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Annotation
 from typing import Optional
 
@@ -25,6 +26,12 @@ class Token(Annotation):
         _pos (Optional[str])
         _lemma (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_lemma': 0,
+        '_pos': 1,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._pos: Optional[str] = None
@@ -41,13 +48,29 @@ class Token(Annotation):
         self._pos = state.get('pos', None) 
         self._lemma = state.get('lemma', None) 
 
+    def _set_all(
+            self, *,
+            _pos=MISSING,
+            _lemma=MISSING,
+            **kwargs):
+        if _pos is not MISSING:
+            self._pos = _pos
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_pos')
+        if _lemma is not MISSING:
+            self._lemma = _lemma
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_lemma')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def pos(self):
         return self._pos
 
     @pos.setter
     def pos(self, pos: Optional[str]):
-        self.set_fields(_pos=pos)
+        self._set_all(_pos=pos)
 
     @property
     def lemma(self):
@@ -55,7 +78,7 @@ class Token(Annotation):
 
     @lemma.setter
     def lemma(self, lemma: Optional[str]):
-        self.set_fields(_lemma=lemma)
+        self._set_all(_lemma=lemma)
 
 
 class EntityMention(Annotation):
@@ -63,6 +86,11 @@ class EntityMention(Annotation):
     Attributes:
         _entity_type (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_entity_type': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._entity_type: Optional[str] = None
@@ -76,10 +104,21 @@ class EntityMention(Annotation):
         super().__setstate__(state)
         self._entity_type = state.get('entity_type', None) 
 
+    def _set_all(
+            self, *,
+            _entity_type=MISSING,
+            **kwargs):
+        if _entity_type is not MISSING:
+            self._entity_type = _entity_type
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_entity_type')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def entity_type(self):
         return self._entity_type
 
     @entity_type.setter
     def entity_type(self, entity_type: Optional[str]):
-        self.set_fields(_entity_type=entity_type)
+        self._set_all(_entity_type=entity_type)
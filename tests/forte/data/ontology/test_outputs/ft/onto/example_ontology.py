@@ -9,6 +9,7 @@ Automatically generated ontology example_ontology. Do not change manually.
 
 from forte.data.data_pack import DataPack
 from forte.data.ontology.core import Entry
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Link
 from ft.onto.example_import_ontology import Token
 from typing import Dict
@@ -29,6 +30,15 @@ class Word(Token):
         _word_forms (Optional[List[int]])	To demonstrate that an attribute can be a List of other entries.
         _token_ranks (Optional[Dict[int, int]])	To demonstrate that an attribute can be a Dict, and the values can be other entries.
     """
+    _FIELD_INDEX = {
+        '_lemma': 0,
+        '_pos': 1,
+        '_string_features': 2,
+        '_token_ranks': 3,
+        '_word_forms': 4,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._string_features: Optional[List[str]] = []
@@ -48,6 +58,27 @@ class Word(Token):
         self._word_forms = state.get('word_forms', None) 
         self._token_ranks = state.get('token_ranks', None) 
 
+    def _set_all(
+            self, *,
+            _string_features=MISSING,
+            _word_forms=MISSING,
+            _token_ranks=MISSING,
+            **kwargs):
+        if _string_features is not MISSING:
+            self._string_features = _string_features
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_string_features')
+        if _word_forms is not MISSING:
+            self._word_forms = _word_forms
+            self._modified_mask |= 1 << 4
+            self.pack.add_field_record(self._tid, '_word_forms')
+        if _token_ranks is not MISSING:
+            self._token_ranks = _token_ranks
+            self._modified_mask |= 1 << 3
+            self.pack.add_field_record(self._tid, '_token_ranks')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def string_features(self):
         return self._string_features
@@ -55,7 +86,7 @@ class Word(Token):
     @string_features.setter
     def string_features(self, string_features: Optional[List[str]]):
         string_features = [] if string_features is None else string_features
-        self.set_fields(_string_features=string_features)
+        self._set_all(_string_features=string_features)
 
     def num_string_features(self):
         return len(self._string_features)
@@ -73,7 +104,7 @@ class Word(Token):
     @word_forms.setter
     def word_forms(self, word_forms: Optional[List["Word"]]):
         word_forms = [] if word_forms is None else word_forms
-        self.set_fields(_word_forms=[self.pack.add_entry_(obj) for obj in word_forms])
+        self._set_all(_word_forms=[self.pack.add_entry_(obj) for obj in word_forms])
 
     def num_word_forms(self):
         return len(self._word_forms)
@@ -92,7 +123,7 @@ class Word(Token):
     @token_ranks.setter
     def token_ranks(self, token_ranks: Optional[Dict[int, "Word"]]):
         token_ranks = {} if token_ranks is None else token_ranks
-        self.set_fields(_token_ranks=dict([(k, self.pack.add_entry_(v)) for k, v in token_ranks.items()]))
+        self._set_all(_token_ranks=dict([(k, self.pack.add_entry_(v)) for k, v in token_ranks.items()]))
 
     def num_token_ranks(self):
         return len(self._token_ranks)
@@ -114,6 +145,11 @@ class WordLink(Link):
 
     ChildType = Word
 
+    _FIELD_INDEX = {
+        '_string_features': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, parent: Optional[Entry] = None, child: Optional[Entry] = None):
         super().__init__(pack, parent, child)
         self._string_features: Optional[List[str]] = []
@@ -127,6 +163,17 @@ class WordLink(Link):
         super().__setstate__(state)
         self._string_features = state.get('string_features', None) 
 
+    def _set_all(
+            self, *,
+            _string_features=MISSING,
+            **kwargs):
+        if _string_features is not MISSING:
+            self._string_features = _string_features
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_string_features')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def string_features(self):
         return self._string_features
@@ -134,7 +181,7 @@ class WordLink(Link):
     @string_features.setter
     def string_features(self, string_features: Optional[List[str]]):
         string_features = [] if string_features is None else string_features
-        self.set_fields(_string_features=string_features)
+        self._set_all(_string_features=string_features)
 
     def num_string_features(self):
         return len(self._string_features)
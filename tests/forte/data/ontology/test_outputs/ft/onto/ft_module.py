@@ -8,6 +8,7 @@ Automatically generated ontology example_multi_module_ontology. Do not change ma
 """
 
 from forte.data.data_pack import DataPack
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Annotation
 from typing import List
 from typing import Optional
@@ -28,6 +29,14 @@ class Token(Annotation):
         _num_chars (Optional[int])
         _score (Optional[float])
     """
+    _FIELD_INDEX = {
+        '_is_verb': 0,
+        '_lemma': 1,
+        '_num_chars': 2,
+        '_score': 3,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._lemma: Optional[str] = None
@@ -50,13 +59,39 @@ class Token(Annotation):
         self._num_chars = state.get('num_chars', None) 
         self._score = state.get('score', None) 
 
+    def _set_all(
+            self, *,
+            _lemma=MISSING,
+            _is_verb=MISSING,
+            _num_chars=MISSING,
+            _score=MISSING,
+            **kwargs):
+        if _lemma is not MISSING:
+            self._lemma = _lemma
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_lemma')
+        if _is_verb is not MISSING:
+            self._is_verb = _is_verb
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_is_verb')
+        if _num_chars is not MISSING:
+            self._num_chars = _num_chars
+            self._modified_mask |= 1 << 2
+            self.pack.add_field_record(self._tid, '_num_chars')
+        if _score is not MISSING:
+            self._score = _score
+            self._modified_mask |= 1 << 3
+            self.pack.add_field_record(self._tid, '_score')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def lemma(self):
         return self._lemma
 
     @lemma.setter
     def lemma(self, lemma: Optional[str]):
-        self.set_fields(_lemma=lemma)
+        self._set_all(_lemma=lemma)
 
     @property
     def is_verb(self):
@@ -64,7 +99,7 @@ class Token(Annotation):
 
     @is_verb.setter
     def is_verb(self, is_verb: Optional[bool]):
-        self.set_fields(_is_verb=is_verb)
+        self._set_all(_is_verb=is_verb)
 
     @property
     def num_chars(self):
@@ -72,7 +107,7 @@ class Token(Annotation):
 
     @num_chars.setter
     def num_chars(self, num_chars: Optional[int]):
-        self.set_fields(_num_chars=num_chars)
+        self._set_all(_num_chars=num_chars)
 
     @property
     def score(self):
@@ -80,7 +115,7 @@ class Token(Annotation):
 
     @score.setter
     def score(self, score: Optional[float]):
-        self.set_fields(_score=score)
+        self._set_all(_score=score)
 
 
 class Sentence(Annotation):
@@ -88,6 +123,11 @@ class Sentence(Annotation):
     Attributes:
         _tokens (Optional[List[int]])
     """
+    _FIELD_INDEX = {
+        '_tokens': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._tokens: Optional[List[int]] = []
@@ -101,6 +141,17 @@ class Sentence(Annotation):
         super().__setstate__(state)
         self._tokens = state.get('tokens', None) 
 
+    def _set_all(
+            self, *,
+            _tokens=MISSING,
+            **kwargs):
+        if _tokens is not MISSING:
+            self._tokens = _tokens
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_tokens')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def tokens(self):
         return [self.pack.get_entry(tid) for tid in self._tokens]
@@ -108,7 +159,7 @@ class Sentence(Annotation):
     @tokens.setter
     def tokens(self, tokens: Optional[List[Token]]):
         tokens = [] if tokens is None else tokens
-        self.set_fields(_tokens=[self.pack.add_entry_(obj) for obj in tokens])
+        self._set_all(_tokens=[self.pack.add_entry_(obj) for obj in tokens])
 
     def num_tokens(self):
         return len(self._tokens)
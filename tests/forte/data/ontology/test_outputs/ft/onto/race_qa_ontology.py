@@ -8,6 +8,7 @@ Automatically generated ontology race_qa_ontology. Do not change manually.
 """
 
 from forte.data.data_pack import DataPack
+from forte.data.ontology.core import MISSING
 from forte.data.ontology.top import Annotation
 from ft.onto.base_ontology import Document
 from typing import List
@@ -32,6 +33,11 @@ class Passage(Document):
     Attributes:
         _passage_id (Optional[str])
     """
+    _FIELD_INDEX = {
+        '_passage_id': 0,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._passage_id: Optional[str] = None
@@ -45,13 +51,24 @@ class Passage(Document):
         super().__setstate__(state)
         self._passage_id = state.get('passage_id', None) 
 
+    def _set_all(
+            self, *,
+            _passage_id=MISSING,
+            **kwargs):
+        if _passage_id is not MISSING:
+            self._passage_id = _passage_id
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_passage_id')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def passage_id(self):
         return self._passage_id
 
     @passage_id.setter
     def passage_id(self, passage_id: Optional[str]):
-        self.set_fields(_passage_id=passage_id)
+        self._set_all(_passage_id=passage_id)
 
 
 class Option(Annotation):
@@ -65,6 +82,12 @@ class Question(Annotation):
         _options (Optional[List[int]])
         _answers (Optional[List[int]])
     """
+    _FIELD_INDEX = {
+        '_answers': 0,
+        '_options': 1,
+    }
+    _FIELD_NAMES = list(_FIELD_INDEX)
+
     def __init__(self, pack: DataPack, begin: int, end: int):
         super().__init__(pack, begin, end)
         self._options: Optional[List[int]] = []
@@ -81,6 +104,22 @@ class Question(Annotation):
         self._options = state.get('options', None) 
         self._answers = state.get('answers', None) 
 
+    def _set_all(
+            self, *,
+            _options=MISSING,
+            _answers=MISSING,
+            **kwargs):
+        if _options is not MISSING:
+            self._options = _options
+            self._modified_mask |= 1 << 1
+            self.pack.add_field_record(self._tid, '_options')
+        if _answers is not MISSING:
+            self._answers = _answers
+            self._modified_mask |= 1 << 0
+            self.pack.add_field_record(self._tid, '_answers')
+        if kwargs:
+            super()._set_all(**kwargs)
+
     @property
     def options(self):
         return [self.pack.get_entry(tid) for tid in self._options]
@@ -88,7 +127,7 @@ class Question(Annotation):
     @options.setter
     def options(self, options: Optional[List[Option]]):
         options = [] if options is None else options
-        self.set_fields(_options=[self.pack.add_entry_(obj) for obj in options])
+        self._set_all(_options=[self.pack.add_entry_(obj) for obj in options])
 
     def num_options(self):
         return len(self._options)
@@ -107,7 +146,7 @@ class Question(Annotation):
     @answers.setter
     def answers(self, answers: Optional[List[int]]):
         answers = [] if answers is None else answers
-        self.set_fields(_answers=answers)
+        self._set_all(_answers=answers)
 
     def num_answers(self):
         return len(self._answers)